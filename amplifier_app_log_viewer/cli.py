@@ -4,7 +4,14 @@ import click
 from pathlib import Path
 
 DEFAULT_PORT = 8180
-DEFAULT_PROJECTS_DIR = Path.home() / ".amplifier" / "projects"
+
+
+def default_projects_dir() -> Path:
+    """Default Amplifier projects directory (resolved lazily by Click).
+
+    Path.home() may hit the passwd database, so it is not evaluated at import.
+    """
+    return Path.home() / ".amplifier" / "projects"
 
 
 @click.group(invoke_without_command=True)
@@ -12,7 +19,7 @@ DEFAULT_PROJECTS_DIR = Path.home() / ".amplifier" / "projects"
 @click.option(
     "--projects-dir",
     type=click.Path(exists=False, path_type=Path),
-    default=DEFAULT_PROJECTS_DIR,
+    default=default_projects_dir,
     help="Path to Amplifier projects directory",
 )
 @click.option(
@@ -57,7 +64,7 @@ def cli(
 @click.option(
     "--projects-dir",
     type=click.Path(exists=False, path_type=Path),
-    default=DEFAULT_PROJECTS_DIR,
+    default=default_projects_dir,
     help="Path to Amplifier projects directory",
 )
 @click.option("--host", "-h", default="127.0.0.1", help="Host to bind to")
@@ -116,7 +123,7 @@ def service(ctx: click.Context) -> None:
 @click.option(
     "--projects-dir",
     type=click.Path(exists=False, path_type=Path),
-    default=DEFAULT_PROJECTS_DIR,
+    default=default_projects_dir,
     help="Path to Amplifier projects directory",
 )
 @click.option(
@@ -0,0 +1,46 @@
+"""JSON decoding with optional orjson acceleration."""
+
+import json
+
+# orjson is an optional C-accelerated parser. It is stricter than the stdlib:
+# it rejects NaN/Infinity (which json.dumps writes by default) and silently
+# turns integers beyond 64 bits into floats. Input it refuses, or that holds
+# a run of 20+ digits (a possible out-of-range integer), goes to json.loads.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Digit runs are found by mapping every digit to b"0" and everything else to
+# b" " and searching for 20 zeros: two C-speed passes, far cheaper than a
+# regex over multi-kilobyte event lines.
+_DIGIT_MASK = bytes(0x30 if 0x30 <= b <= 0x39 else 0x20 for b in range(256))
+_LONG_DIGIT_RUN = b"0" * 20
+
+
+def loads(data: bytes | str):
+    """
+    Decode a JSON document, preferring orjson when it is installed.
+
+    Args:
+        data: JSON text as UTF-8 bytes or str
+
+    Returns:
+        The decoded Python object, identical to what json.loads returns
+
+    Raises:
+        json.JSONDecodeError: If the input is not valid JSON (including
+            bytes that are not valid UTF-8)
+    """
+    if isinstance(data, str):
+        data = data.encode()
+    if orjson is not None:
+        if _LONG_DIGIT_RUN not in data.translate(_DIGIT_MASK):
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                pass
+    try:
+        return json.loads(data)
+    except UnicodeDecodeError as e:
+        raise json.JSONDecodeError(f"Invalid UTF-8: {e.reason}", "", e.start) from None
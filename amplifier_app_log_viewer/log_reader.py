@@ -1,8 +1,21 @@
 """JSONL log file reader with pagination and progressive loading support."""
 
 import json
+import mmap
+import os
+import sys
+import threading
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from pathlib import Path
 
+from .fastjson import loads as _loads
+
+# Slice size for newline counting over a mapped file: large enough that the
+# per-slice call overhead vanishes, small enough to bound the temporary copy.
+_COUNT_CHUNK_SIZE = 4 * 1024 * 1024
+
 
 def read_event_list(file_path: Path, offset: int = 0, limit: int = 200) -> dict:
     """
@@ -12,6 +25,13 @@ def read_event_list(file_path: Path, offset: int = 0, limit: int = 200) -> dict:
     the event list view, not the full payload. Supports pagination via
     offset and limit.
 
+    Like tail_events(), a trailing line without its newline yet is left out:
+    tail_position stops after the last complete line, so the poller picks
+    that line up once it is finished instead of skipping past it.
+
+    Results are cached per (file, offset, limit). An unchanged file is
+    served from the cache; a file that grew only has its new lines parsed.
+
     Args:
         file_path: Path to events.jsonl file
         offset: Line number to start reading from (0-indexed)
@@ -30,82 +50,102 @@ def read_event_list(file_path: Path, offset: int = 0, limit: int = 200) -> dict:
         "tail_line_count": 0,
     }
 
-    if not file_path.exists():
-        return empty
-
-    events = []
-    hit_limit = False
-
     try:
         with open(file_path, "rb") as f:
-            byte_pos = 0
-
-            # Skip to offset
-            for _ in range(offset):
-                raw_line = f.readline()
-                if not raw_line:
-                    break
-                byte_pos += len(raw_line)
-
-            # Read up to limit lines
-            lines_read = 0
-            while lines_read < limit:
-                raw_line = f.readline()
-                if not raw_line:
-                    break
-                current_offset = byte_pos
-                byte_pos += len(raw_line)
-
-                line = raw_line.strip()
-                if not line:
-                    lines_read += 1
-                    continue
-
-                try:
-                    event = json.loads(line)
-                    # Extract only what we need for list display
-                    events.append(
-                        {
-                            "line": offset + lines_read,
-                            "byte_offset": current_offset,
-                            "ts": event.get("ts"),
-                            "event": event.get("event"),
-                            "lvl": event.get("lvl"),
-                            "session_id": event.get("session_id"),
-                            "preview": _compute_preview(event),
-                            "size": len(line),  # Byte size of the raw line
-                        }
-                    )
-                except json.JSONDecodeError:
-                    pass
-
-                lines_read += 1
-
-            # Check if there are more lines after the ones we read
-            # by attempting to read one more line (avoids full file scan)
-            if lines_read == limit:
-                next_line = f.readline()
-                hit_limit = bool(next_line)
+            # Snapshot the size once: the mapping, the scan and the tail
+            # position handed to the poller all refer to the same bytes.
+            st = os.fstat(f.fileno())
+            size = st.st_size
+            if size == 0:
+                return empty
+
+            cache_key = (file_path, offset, limit)
+            with _event_list_lock:
+                page = _event_list_cache.get(cache_key)
+            if page is not None:
+                if page.size == size and page.mtime_ns == st.st_mtime_ns:
+                    return page.result
+                if page.size >= size:
+                    page = None  # Truncated or rewritten — rescan
+            if page is None:
+                page = _EventListPage()
+
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if hasattr(mmap, "MADV_SEQUENTIAL"):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+
+                # Only scan up to the end of the last newline-terminated line
+                tail_position = mm.rfind(b"\n", 0, size) + 1
+
+                events = page.result["events"][: page.resume_events]
+                lines_read = page.resume_lines
+
+                if page.resume_pos is None:
+                    # Skip to offset via the line index instead of walking
+                    # every preceding line
+                    start = get_line_offset(file_path, offset) if offset else 0
+                    if start is not None and start <= tail_position:
+                        byte_pos = start
+                        resume = (0, 0, byte_pos)
+                    else:
+                        # Fewer than offset lines in this snapshot
+                        byte_pos = tail_position
+                        resume = (0, 0, None)
+                else:
+                    # File grew since this page was cached: keep the events
+                    # already parsed and continue after the last full line.
+                    byte_pos = page.resume_pos
+                    resume = (len(events), lines_read, byte_pos)
+
+                # Read up to limit lines (all newline-terminated)
+                while lines_read < limit and byte_pos < tail_position:
+                    current_offset = byte_pos
+                    line_end = mm.find(b"\n", byte_pos)
+                    byte_pos = line_end + 1
+
+                    line = mm[current_offset:line_end]
+                    if line.endswith(b"\r"):
+                        line = line[:-1]
+                    if line:
+                        try:
+                            event = _parse_list_event(line)
+                            # Extract only what we need for list display
+                            events.append(
+                                {
+                                    "line": offset + lines_read,
+                                    "byte_offset": current_offset,
+                                    "ts": event.get("ts"),
+                                    "event": _intern(event.get("event")),
+                                    "lvl": _intern(event.get("lvl")),
+                                    "session_id": _intern(event.get("session_id")),
+                                    "preview": _compute_preview(event),
+                                    "size": len(line),  # Byte size of the raw line
+                                }
+                            )
+                        except json.JSONDecodeError:
+                            pass
 
+                    lines_read += 1
+                    resume = (len(events), lines_read, byte_pos)
+
+                # There are more lines if the scan stopped before the tail
+                hit_limit = lines_read == limit and byte_pos < tail_position
+                if hit_limit:
+                    # More events than limit — need exact total for line
+                    # numbering. Count the rest of the mapping in place
+                    # rather than reading the whole file a second time.
+                    total = offset + lines_read + _count_mapped_newlines(mm, byte_pos)
+                else:
+                    # All events fit — we have the exact count already
+                    total = offset + len(events)
+
+    except FileNotFoundError:
+        return empty
     except OSError as e:
         print(f"Warning: Error reading {file_path}: {e}")
         return empty
 
-    # Tail position for polling: O(1) stat call — no file reading
-    try:
-        tail_position = file_path.stat().st_size
-    except OSError:
-        tail_position = 0
-
-    if hit_limit:
-        # More events than limit — need exact total for line numbering.
-        # count_lines scans bytes in 1MB chunks (no JSON parsing) — fast.
-        total = count_lines(file_path)
-    else:
-        # All events fit — we have the exact count already
-        total = offset + len(events)
-
-    return {
+    result = {
         "events": events,
         "total": total,
         "offset": offset,
@@ -115,6 +155,36 @@ def read_event_list(file_path: Path, offset: int = 0, limit: int = 200) -> dict:
         "tail_line_count": total,
     }
 
+    with _event_list_lock:
+        _event_list_cache[cache_key] = _EventListPage(
+            size, st.st_mtime_ns, result, *resume
+        )
+        _event_list_cache.move_to_end(cache_key)
+        while len(_event_list_cache) > _EVENT_LIST_MAX_PAGES:
+            _event_list_cache.popitem(last=False)
+
+    return result
+
+
+@dataclass
+class _EventListPage:
+    """A cached read_event_list() result and where its scan can resume."""
+
+    size: int = 0
+    mtime_ns: int = 0
+    result: dict = field(default_factory=lambda: {"events": []})
+    # Events, lines and byte position up to the last newline-terminated line
+    resume_events: int = 0
+    resume_lines: int = 0
+    resume_pos: int | None = None
+
+
+# Event logs are append-only, so a cached page stays valid until the file
+# grows, and then only the appended bytes need parsing.
+_EVENT_LIST_MAX_PAGES = 64
+_event_list_cache: OrderedDict[tuple[Path, int, int], _EventListPage] = OrderedDict()
+_event_list_lock = threading.Lock()
+
 
 def read_single_event(
     file_path: Path, line_num: int, byte_offset: int | None = None
@@ -123,7 +193,8 @@ def read_single_event(
     Read a single event by line number.
 
     If byte_offset is provided, seeks directly to that offset for O(1) access.
-    Otherwise falls back to a linear scan for backward compatibility.
+    Otherwise the offset is looked up in the file's cached line index, which
+    is built once and extended incrementally as the log grows.
 
     Args:
         file_path: Path to events.jsonl file
@@ -133,48 +204,63 @@ def read_single_event(
     Returns:
         Full event dict with line number added, or None if not found
     """
-    if not file_path.exists():
-        return None
-
     try:
-        if byte_offset is not None:
-            # Fast path: seek directly to byte offset
-            with open(file_path, "rb") as f:
-                f.seek(byte_offset)
-                raw_line = f.readline()
-                if raw_line:
-                    line = raw_line.strip()
-                    if line:
-                        try:
-                            event = json.loads(line)
-                            event["line"] = line_num
-                            return event
-                        except json.JSONDecodeError:
-                            return None
-                return None
+        if byte_offset is None:
+            byte_offset = get_line_offset(file_path, line_num)
+            if byte_offset is None:
+                return None  # Line not found (file has fewer lines)
 
-        # Fallback: linear scan (backward compatibility)
-        with open(file_path, encoding="utf-8") as f:
-            for current_line, line in enumerate(f):
-                if current_line == line_num:
-                    line = line.strip()
-                    if line:
-                        try:
-                            event = json.loads(line)
-                            event["line"] = line_num  # Include line number
-                            return event
-                        except json.JSONDecodeError:
-                            return None
-                    return None
-                # Skip past the target line - event not found
-                if current_line > line_num:
-                    return None
+        with open(file_path, "rb") as f:
+            f.seek(byte_offset)
+            raw_line = f.readline()
+            try:
+                # The parser ignores the trailing newline; a blank line fails
+                # to parse just like a corrupt one
+                event = _loads(raw_line)
+            except json.JSONDecodeError:
+                return None
+            event["line"] = line_num  # Include line number
+            return event
 
+    except FileNotFoundError:
+        return None
     except OSError as e:
         print(f"Warning: Error reading {file_path}: {e}")
         return None
 
-    return None  # Line not found (file has fewer lines)
+
+# Header fields every list entry carries; the payload is under "data"
+_HEADER_KEYS = frozenset(("ts", "event", "lvl", "session_id"))
+
+
+def _parse_list_event(line: bytes) -> dict:
+    """
+    Parse a JSONL line for list display, skipping the payload when possible.
+
+    Events are written with their header fields before "data", and the
+    payload (LLM requests, tool output) is usually most of the line. When
+    the event type has no preview, only the bytes before "data" are
+    decoded. Anything unusual (missing header keys, "data" first, odd
+    formatting) falls back to a full parse.
+    """
+    idx = line.find(b'"data":')
+    if idx > 0:
+        try:
+            header = _loads(line[:idx].rstrip(b", \t") + b"}")
+        except json.JSONDecodeError:
+            header = None
+        if isinstance(header, dict) and _HEADER_KEYS <= header.keys():
+            event_type = header["event"]
+            if isinstance(event_type, str):
+                prefix, sep, _ = event_type.partition(":")
+                if not sep or prefix not in _PREVIEW_HANDLERS:
+                    return header
+    return _loads(line)
+
+
+def _intern(value):
+    """Intern a low-cardinality string field so repeated rows share one object."""
+    return sys.intern(value) if type(value) is str else value
 
 
 def _compute_preview(event: dict) -> str:
@@ -183,57 +269,91 @@ def _compute_preview(event: dict) -> str:
     if not data:
         return ""
 
-    event_type = event.get("event", "")
+    # Dispatch on the event namespace ("llm", "tool", ...) with one dict
+    # lookup instead of testing every known prefix in turn.
+    prefix, sep, _ = (event.get("event") or "").partition(":")
+    handler = _PREVIEW_HANDLERS.get(prefix) if sep else None
+    if handler is None:
+        return ""
+    return handler(event["event"], data)
+
 
+def _preview_llm(event_type: str, data: dict) -> str:
+    """Preview for llm:* events: model/tokens for debug events, else provider."""
     # LLM debug events (nested data.data structure)
     if ":debug" in event_type:
-        nested_data = data.get("data", {})
-
         if event_type.startswith("llm:request"):
-            request = nested_data.get("request", {})
-            model = request.get("model", "")
-            msg_count = len(request.get("messages", []))
-            if model and msg_count > 0:
-                return f"{model} | {msg_count} messages"
+            model = _dig(data, _REQUEST_MODEL)
+            messages = _dig(data, _REQUEST_MESSAGES)
+            if model and messages:
+                return f"{model} | {len(messages)} messages"
 
         if event_type.startswith("llm:response"):
-            response = nested_data.get("response", {})
-            usage = response.get("usage", {})
-            tokens = usage.get("total_tokens") or usage.get("input_tokens")
+            tokens = _dig(data, _USAGE_TOTAL_TOKENS) or _dig(data, _USAGE_INPUT_TOKENS)
             if tokens:
                 return f"{tokens} tokens"
 
     # Standard LLM events
-    if event_type.startswith("llm:"):
-        nested_data = data.get("data", data)
-        provider = nested_data.get("provider")
-        if provider:
-            return f"Provider: {provider}"
-
-    # Tool events
-    if event_type.startswith("tool:"):
-        tool_name = data.get("tool_name") or data.get("name")
-        if tool_name:
-            return f"Tool: {tool_name}"
-
-    # Prompt events
-    if event_type.startswith("prompt:"):
-        prompt = data.get("prompt", "")
-        if prompt:
-            if len(prompt) < 60:
-                return prompt
-            return prompt[:57] + "..."
-
-    # Content block events
-    if event_type.startswith("content_block:"):
-        block_type = data.get("block_type")
-        block_index = data.get("block_index")
-        if block_type is not None and block_index is not None:
-            return f"Block {block_index}: {block_type}"
+    nested_data = data.get("data", data)
+    provider = _dig(nested_data, _PROVIDER)
+    if provider:
+        return f"Provider: {provider}"
+    return ""
+
 
+def _preview_tool(event_type: str, data: dict) -> str:
+    """Preview for tool:* events."""
+    tool_name = data.get("tool_name") or data.get("name")
+    if tool_name:
+        return f"Tool: {tool_name}"
     return ""
 
 
+def _preview_prompt(event_type: str, data: dict) -> str:
+    """Preview for prompt:* events."""
+    prompt = data.get("prompt", "")
+    if prompt:
+        if len(prompt) < 60:
+            return prompt
+        return prompt[:57] + "..."
+    return ""
+
+
+def _preview_content_block(event_type: str, data: dict) -> str:
+    """Preview for content_block:* events."""
+    block_type = data.get("block_type")
+    block_index = data.get("block_index")
+    if block_type is not None and block_index is not None:
+        return f"Block {block_index}: {block_type}"
+    return ""
+
+
+# Key paths into an event's "data" payload, walked by _dig()
+_REQUEST_MODEL = ("data", "request", "model")
+_REQUEST_MESSAGES = ("data", "request", "messages")
+_USAGE_TOTAL_TOKENS = ("data", "response", "usage", "total_tokens")
+_USAGE_INPUT_TOKENS = ("data", "response", "usage", "input_tokens")
+_PROVIDER = ("provider",)
+
+
+def _dig(obj, path: tuple[str, ...]):
+    """Follow a key path through nested dicts, or return None if it breaks."""
+    try:
+        for key in path:
+            obj = obj.get(key)
+    except AttributeError:
+        return None
+    return obj
+
+
+_PREVIEW_HANDLERS = {
+    "llm": _preview_llm,
+    "tool": _preview_tool,
+    "prompt": _preview_prompt,
+    "content_block": _preview_content_block,
+}
+
+
 def read_events(
     file_path: Path, offset: int = 0, limit: int = 100
 ) -> tuple[list[dict], int]:
@@ -255,42 +375,51 @@ def read_events(
     Raises:
         FileNotFoundError: If log file doesn't exist
     """
-    if not file_path.exists():
-        return [], 0
-
     events = []
 
     try:
-        with open(file_path, encoding="utf-8") as f:
-            # Skip to offset
-            for _ in range(offset):
-                line = f.readline()
-                if not line:
-                    break
-
-            # Read next 'limit' lines
-            for _ in range(limit):
-                line = f.readline()
-                if not line:
-                    break
-
-                line = line.strip()
-                if not line:
-                    continue
-
-                try:
-                    event = json.loads(line)
-                    events.append(event)
-                except json.JSONDecodeError:
-                    # Skip corrupted lines
-                    continue
-
-            # Count total lines for pagination
-            total_lines = offset + len(events)
-            for line in f:
-                if line.strip():
-                    total_lines += 1
-
+        with open(file_path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size == 0:
+                return [], 0
+
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if hasattr(mmap, "MADV_SEQUENTIAL"):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+
+                # Skip to offset via the line index
+                pos = get_line_offset(file_path, offset) if offset else 0
+                if pos is None:
+                    pos = size
+
+                # Read next 'limit' lines
+                for _ in range(limit):
+                    if pos >= size:
+                        break
+                    nl = mm.find(b"\n", pos)
+                    line_end = size if nl == -1 else nl
+                    line = mm[pos:line_end]
+                    pos = line_end + 1
+                    if not line:
+                        continue
+
+                    try:
+                        event = _loads(line)
+                        events.append(event)
+                    except json.JSONDecodeError:
+                        # Skip corrupted lines
+                        continue
+
+                # Count remaining lines for pagination (chunked newline
+                # count, no per-line iteration)
+                remaining = _count_mapped_newlines(mm, pos)
+                if pos < size and mm[size - 1] != ord("\n"):
+                    # Final line without a trailing newline (still being written)
+                    remaining += 1
+                total_lines = offset + len(events) + remaining
+
+    except FileNotFoundError:
+        return [], 0
     except OSError as e:
         # Handle I/O errors (cloud sync, permissions, etc.)
         print(f"Warning: Error reading {file_path}: {e}")
@@ -308,6 +437,10 @@ def tail_events(
     Used by SSE streaming to detect new log entries. The caller tracks
     both last_position and last_line_count, so this function only needs
     to seek to last_position and read forward — no byte-0 re-scan.
+    A trailing line without its newline yet is left for the next call.
+    Callers asking for the same delta of an unchanged file share one parse:
+    each gets its own list, but the event dicts in it are shared and must
+    be treated as read-only.
 
     Args:
         file_path: Path to events.jsonl file
@@ -316,58 +449,89 @@ def tail_events(
 
     Returns:
         Tuple of (new_events, new_position, new_line_count) where
-        new_events is list of lightweight event dicts, new_position is
-        current byte offset, and new_line_count is updated line count
+        new_events is list of lightweight event dicts, new_position is the
+        byte offset just past the last complete line, and new_line_count is
+        updated line count
     """
-    if not file_path.exists():
-        return [], 0, 0
-
     new_events = []
-    new_position = last_position
     line_count = last_line_count
 
     try:
-        with open(file_path, encoding="utf-8") as f:
-            # Seek directly to last position — no re-scan needed
+        with open(file_path, "rb") as f:
+            st = os.fstat(f.fileno())
+            size = st.st_size
+            if size <= last_position:
+                return [], last_position, last_line_count
+
+            # Another viewer of this session may have just read the same delta
+            cache_key = (file_path, last_position, last_line_count)
+            with _tail_lock:
+                cached = _tail_cache.get(cache_key)
+            if cached is not None and cached[:2] == (size, st.st_mtime_ns):
+                events, position, count = cached[2]
+                return list(events), position, count
+
+            # Everything appended since the last poll, in a single read
             f.seek(last_position)
+            chunk = f.read(size - last_position)
 
-            for line in f:
-                line_stripped = line.strip()
-                if not line_stripped:
-                    continue
-
-                try:
-                    event = json.loads(line_stripped)
-                    # Return lightweight format for SSE
-                    new_events.append(
-                        {
-                            "line": line_count,
-                            "ts": event.get("ts"),
-                            "event": event.get("event"),
-                            "lvl": event.get("lvl"),
-                            "session_id": event.get("session_id"),
-                            "preview": _compute_preview(event),
-                            "size": len(line_stripped),
-                        }
-                    )
-                    line_count += 1
-                except json.JSONDecodeError:
-                    # Skip corrupted lines
-                    continue
-
-            # Get current position
-            new_position = f.tell()
-
+    except FileNotFoundError:
+        return [], 0, 0
     except OSError as e:
         print(f"Warning: Error tailing {file_path}: {e}")
-        return new_events, last_position, last_line_count
-
-    return new_events, new_position, line_count
+        return [], last_position, last_line_count
+
+    # The piece after the last newline is a line still being written (or
+    # empty). Leave it for the next poll rather than dropping it as corrupt.
+    lines = chunk.split(b"\n")
+    partial = lines.pop()
+    new_position = last_position + len(chunk) - len(partial)
+
+    for line in lines:
+        if line.endswith(b"\r"):
+            line = line[:-1]
+        if not line:
+            continue
+
+        try:
+            event = _parse_list_event(line)
+            # Return lightweight format for SSE
+            new_events.append(
+                {
+                    "line": line_count,
+                    "ts": event.get("ts"),
+                    "event": _intern(event.get("event")),
+                    "lvl": _intern(event.get("lvl")),
+                    "session_id": _intern(event.get("session_id")),
+                    "preview": _compute_preview(event),
+                    "size": len(line),
+                }
+            )
+            line_count += 1
+        except json.JSONDecodeError:
+            # Skip corrupted lines
+            continue
+
+    result = (new_events, new_position, line_count)
+    with _tail_lock:
+        _tail_cache[cache_key] = (size, st.st_mtime_ns, result)
+        _tail_cache.move_to_end(cache_key)
+        while len(_tail_cache) > _TAIL_CACHE_MAX:
+            _tail_cache.popitem(last=False)
+
+    return list(new_events), new_position, line_count
+
+
+# Every open tab on a session polls for the same delta; the parsed result is
+# kept until the file changes so they share a single read and parse.
+_TAIL_CACHE_MAX = 64
+_tail_cache: OrderedDict[tuple[Path, int, int], tuple[int, int, tuple]] = OrderedDict()
+_tail_lock = threading.Lock()
 
 
 def count_lines(file_path: Path) -> int:
     """
-    Fast line counting using buffered binary read.
+    Fast line counting over a memory-mapped file.
 
     Args:
         file_path: Path to file
@@ -375,17 +539,97 @@ def count_lines(file_path: Path) -> int:
     Returns:
         Number of newline-delimited lines in file
     """
-    if not file_path.exists():
-        return 0
-
     try:
-        count = 0
         with open(file_path, "rb") as f:
-            while True:
-                buf = f.read(1024 * 1024)  # 1MB chunks
-                if not buf:
-                    break
-                count += buf.count(b"\n")
-        return count
+            if os.fstat(f.fileno()).st_size == 0:
+                return 0  # mmap cannot map an empty file
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if hasattr(mmap, "MADV_SEQUENTIAL"):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                return _count_mapped_newlines(mm, 0)
     except OSError:
         return 0
+
+
+def _count_mapped_newlines(mm: mmap.mmap, start: int) -> int:
+    """Count newline bytes in a memory-mapped file from start to the end."""
+    count = 0
+    for chunk_start in range(start, len(mm), _COUNT_CHUNK_SIZE):
+        count += mm[chunk_start : chunk_start + _COUNT_CHUNK_SIZE].count(b"\n")
+    return count
+
+
+@dataclass
+class _LineIndex:
+    """Start offsets of every newline-terminated line in an append-only file."""
+
+    offsets: array = field(default_factory=lambda: array("Q"))
+    # Byte position just past the last indexed newline
+    end: int = 0
+    # Guards offsets/end while the file is being indexed
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+
+# Line indexes are kept in memory for the most recently used files only.
+# _line_index_lock only guards this mapping; indexing a file happens under
+# that file's own lock so one large log never blocks lookups in others.
+_LINE_INDEX_MAX_FILES = 64
+_line_indexes: OrderedDict[Path, _LineIndex] = OrderedDict()
+_line_index_lock = threading.Lock()
+
+
+def get_line_offset(file_path: Path, line_num: int) -> int | None:
+    """
+    Get the byte offset where a line starts, using a cached line index.
+
+    The index is built on first use and, since event logs are append-only,
+    only the bytes appended since the previous call are scanned afterwards.
+    A file that shrank (truncated or replaced) is re-indexed from scratch.
+
+    Args:
+        file_path: Path to events.jsonl file
+        line_num: Line number (0-indexed)
+
+    Returns:
+        Byte offset of the line, or None if the file has fewer lines
+    """
+    if line_num < 0:
+        return None
+
+    with _line_index_lock:
+        index = _line_indexes.pop(file_path, None) or _LineIndex()
+        _line_indexes[file_path] = index
+        while len(_line_indexes) > _LINE_INDEX_MAX_FILES:
+            _line_indexes.popitem(last=False)
+
+    with index.lock:
+        try:
+            size = file_path.stat().st_size
+            if size < index.end:
+                index.offsets = array("Q")
+                index.end = 0
+            if size > index.end:
+                _extend_line_index(file_path, index)
+        except (OSError, ValueError):
+            # ValueError: mmap of a file truncated to empty after the stat
+            return None
+
+        if line_num < len(index.offsets):
+            return index.offsets[line_num]
+        if line_num == len(index.offsets) and index.end < size:
+            # Final line without a trailing newline (possibly still being written)
+            return index.end
+        return None
+
+
+def _extend_line_index(file_path: Path, index: _LineIndex) -> None:
+    """Index the lines appended to file_path after index.end."""
+    offsets = index.offsets
+    pos = index.end
+    with open(file_path, "rb") as f, mmap.mmap(
+        f.fileno(), 0, access=mmap.ACCESS_READ
+    ) as mm:
+        while (nl := mm.find(b"\n", pos)) != -1:
+            offsets.append(pos)
+            pos = nl + 1
+    index.end = pos
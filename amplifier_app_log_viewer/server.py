@@ -1,11 +1,14 @@
 """Flask server with REST API and SSE streaming."""
 
+import gzip
 import json
 import threading
 import time
+from collections import OrderedDict
 from datetime import datetime
 from datetime import timedelta
 from datetime import timezone
+from functools import lru_cache
 from pathlib import Path
 
 from flask import Blueprint
@@ -14,9 +17,25 @@ from flask import current_app
 from flask import jsonify
 from flask import render_template
 from flask import request
+from flask.json.provider import DefaultJSONProvider
 
 from . import log_reader
 from . import session_scanner
+from .fastjson import loads as _loads
+
+# orjson is an optional speedup for encoding API responses (event lists can
+# run to thousands of rows); without it the stdlib json module is used.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# zstandard is optional too: when present, clients that advertise zstd get it
+# in preference to gzip (similar ratio on JSON, several times faster).
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
 
 
 def parse_date_filter(since: str | None) -> datetime | None:
@@ -31,61 +50,43 @@ def parse_date_filter(since: str | None) -> datetime | None:
     if not since:
         return None
 
-    # Handle relative periods
+    # Handle relative periods (resolved against "now" on every call)
     if since.endswith("d"):
-        try:
-            days = int(since[:-1])
-            return datetime.now(timezone.utc) - timedelta(days=days)
-        except ValueError:
-            pass
+        delta = _parse_relative(since)
+        if delta is not None:
+            return datetime.now(timezone.utc) - delta
 
     # Handle ISO date strings
-    try:
-        # Try parsing as ISO format
-        dt = datetime.fromisoformat(since.replace("Z", "+00:00"))
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=timezone.utc)
-        return dt
-    except ValueError:
-        pass
-
-    return None
-
+    return _parse_absolute(since)
 
-def session_in_date_range(
-    session, start: datetime | None, end: datetime | None = None
-) -> bool:
-    """Check if a session's timestamp is within the date range.
 
-    Args:
-        session: Session object with timestamp attribute
-        start: Start of range (inclusive), or None for no lower bound
-        end: End of range (inclusive), or None for no upper bound
-    """
-    if start is None and end is None:
-        return True
+@lru_cache(maxsize=256)
+def _parse_relative(since: str) -> timedelta | None:
+    """Parse a relative period like '7d' into a timedelta, or None."""
+    try:
+        return timedelta(days=int(since[:-1]))
+    except ValueError:
+        return None
 
-    if not session.timestamp:
-        # Sessions without timestamps are excluded when filtering
-        return False
 
+@lru_cache(maxsize=256)
+def _parse_absolute(since: str) -> datetime | None:
+    """Parse an ISO date string into an aware datetime (UTC if no offset), or None."""
     try:
-        session_dt = datetime.fromisoformat(session.timestamp.replace("Z", "+00:00"))
-        if session_dt.tzinfo is None:
-            session_dt = session_dt.replace(tzinfo=timezone.utc)
-
-        if start and session_dt < start:
-            return False
-        if end and session_dt > end:
-            return False
-        return True
-    except (ValueError, AttributeError):
-        return False
+        # 3.11+ accepts a trailing "Z" natively
+        dt = datetime.fromisoformat(since)
+    except ValueError:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt
 
 
 bp = Blueprint("app", __name__)
 
-# Global state
+# Global state. refresh_session_tree() publishes each new tree with a single
+# reference swap, so handlers read _session_tree once into a local and work
+# against that snapshot for the rest of the request.
 _session_tree = None
 _projects_dir = None
 _last_scan_time = 0
@@ -93,6 +94,55 @@ _cache_duration = (
     30  # Seconds before auto-refresh (increased - incremental scans are fast)
 )
 _refresh_lock = threading.Lock()
+_tree_generation = 0  # Bumped after every refresh; keys _payload_cache
+
+# Serialized /api/projects and /api/sessions bodies, reused until the next
+# refresh. Keyed by tree generation plus the request's filters.
+_PAYLOAD_CACHE_MAX = 256
+_payload_cache: OrderedDict[tuple, bytes] = OrderedDict()
+_payload_lock = threading.Lock()
+
+# Parsed metadata.json contexts, keyed by path and validated by mtime + size
+_METADATA_CACHE_MAX = 1024
+_metadata_cache: OrderedDict[Path, tuple[int, int, dict]] = OrderedDict()
+_metadata_lock = threading.Lock()
+
+# JSON bodies smaller than this are sent uncompressed (not worth the CPU)
+_COMPRESS_MIN_SIZE = 4096
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider that encodes with orjson.
+
+    Keeps Flask's defaults that affect output (sorted keys, indentation in
+    debug mode) and falls back to the stdlib encoder for any call that passes
+    json.dumps-specific options.
+    """
+
+    def _options(self) -> int:
+        option = orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if (self.compact is None and self._app.debug) or self.compact is False:
+            option |= orjson.OPT_INDENT_2
+        return option
+
+    def dumps(self, obj, **kwargs) -> str:
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+        return orjson.dumps(obj, default=self.default, option=self._options()).decode()
+
+    def loads(self, s, **kwargs):
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return _loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default, option=self._options()),
+            mimetype=self.mimetype,
+        )
 
 
 def inject_base_path():
@@ -100,6 +150,136 @@ def inject_base_path():
     return {"BASE_PATH": current_app.config.get("APPLICATION_ROOT", "")}
 
 
+def compress_json_response(response):
+    """Compress large JSON responses for clients that accept it.
+
+    Event lists and payloads are repetitive text that shrinks several-fold,
+    which matters when the viewer is reached over the network (--host 0.0.0.0
+    or behind a reverse proxy). zstd is used when available and accepted,
+    otherwise gzip.
+    """
+    if (
+        response.status_code != 200
+        or response.mimetype != "application/json"
+        or response.direct_passthrough
+        or "Content-Encoding" in response.headers
+    ):
+        return response
+
+    response.vary.add("Accept-Encoding")
+    use_zstd = zstandard is not None and request.accept_encodings["zstd"]
+    if not use_zstd and not request.accept_encodings["gzip"]:
+        return response
+
+    data = response.get_data()
+    if len(data) < _COMPRESS_MIN_SIZE:
+        return response
+
+    if use_zstd:
+        response.set_data(_zstd_compressor().compress(data))
+        response.headers["Content-Encoding"] = "zstd"
+    else:
+        response.set_data(gzip.compress(data, compresslevel=5, mtime=0))
+        response.headers["Content-Encoding"] = "gzip"
+    return response
+
+
+_zstd_local = threading.local()
+
+
+def _zstd_compressor():
+    """Return this thread's zstd compressor (they are not thread-safe)."""
+    compressor = getattr(_zstd_local, "compressor", None)
+    if compressor is None:
+        compressor = _zstd_local.compressor = zstandard.ZstdCompressor(level=3)
+    return compressor
+
+
+def revalidate_with_etag(response):
+    """Let clients keep a polled response but revalidate it on every request.
+
+    The weak ETag is derived from the body, so an unchanged result is answered
+    with an empty 304 instead of being re-sent.
+    """
+    response.headers["Cache-Control"] = "no-cache"
+    response.headers["Pragma"] = "no-cache"
+    response.headers["Expires"] = "0"
+    response.add_etag(weak=True)
+    return response.make_conditional(request)
+
+
+def _is_relative_filter(value: str | None) -> bool:
+    """Whether a date filter is relative to now (its cutoff moves with the clock)."""
+    return bool(value) and value.endswith("d") and _parse_relative(value) is not None
+
+
+def cached_json(key: tuple | None, build):
+    """JSON response for build(), reusing the serialized body cached under key.
+
+    Args:
+        key: Cache key, or None to skip the cache. Keys must start from the
+             tree generation read *before* the tree itself, so an entry never
+             holds data older than its generation.
+        build: Zero-argument callable returning the payload
+
+    Returns:
+        Flask response with the JSON body
+    """
+    if key is not None:
+        with _payload_lock:
+            body = _payload_cache.get(key)
+            if body is not None:
+                _payload_cache.move_to_end(key)
+        if body is not None:
+            return current_app.response_class(body, mimetype="application/json")
+
+    response = jsonify(build())
+    if key is not None:
+        with _payload_lock:
+            _payload_cache[key] = response.get_data()
+            while len(_payload_cache) > _PAYLOAD_CACHE_MAX:
+                _payload_cache.popitem(last=False)
+    return response
+
+
+def _normalize_base_path(base_path: str) -> str:
+    """Validate a base path and strip its trailing slash.
+
+    Args:
+        base_path: Raw base path, e.g. '/amplifier/logs/' or ''.
+
+    Returns:
+        The base path without a trailing slash ('' for root).
+
+    Raises:
+        ValueError: If the path is relative or could escape its prefix.
+    """
+    if not base_path:
+        return ""
+
+    # Validate base path format
+    if not base_path.startswith("/"):
+        raise ValueError(
+            f"base_path must start with '/': {base_path!r}. "
+            f"Did you mean '/{base_path}'?"
+        )
+
+    # Prevent path traversal attempts, including percent-encoded dots and
+    # backslashes, which some proxies treat as separators
+    if ".." in base_path or "%2e%2e" in base_path.lower() or "\\" in base_path:
+        raise ValueError(
+            f"base_path cannot contain '..' for security reasons: {base_path!r}"
+        )
+
+    # Remove trailing slash for consistency
+    base_path = base_path.rstrip("/")
+
+    if "//" in base_path:
+        raise ValueError(f"base_path cannot contain empty segments: {base_path!r}")
+
+    return base_path
+
+
 def create_app(projects_dir: str | Path | None = None, base_path: str = "") -> Flask:
     """Create and configure the Flask application.
 
@@ -114,35 +294,19 @@ def create_app(projects_dir: str | Path | None = None, base_path: str = "") -> F
     Returns:
         Configured Flask application
     """
-    normalized_base_path = base_path or ""
+    normalized_base_path = _normalize_base_path(base_path or "")
 
     if projects_dir is None:
         projects_dir = Path.home() / ".amplifier" / "projects"
     else:
         projects_dir = Path(projects_dir)
 
-    # Set base path (always reset global state, even if empty)
-    if normalized_base_path:
-        # Validate base path format
-        if not normalized_base_path.startswith("/"):
-            raise ValueError(
-                f"base_path must start with '/': {normalized_base_path!r}. "
-                f"Did you mean '/{normalized_base_path}'?"
-            )
-
-        # Prevent path traversal attempts
-        if ".." in normalized_base_path:
-            raise ValueError(
-                f"base_path cannot contain '..' for security reasons: "
-                f"{normalized_base_path!r}"
-            )
-
-        # Remove trailing slash for consistency
-        normalized_base_path = normalized_base_path.rstrip("/")
-
     app = Flask(__name__)
+    if orjson is not None:
+        app.json = OrjsonProvider(app)
     app.config["APPLICATION_ROOT"] = normalized_base_path
     app.context_processor(inject_base_path)
+    app.after_request(compress_json_response)
     app.register_blueprint(bp, url_prefix=normalized_base_path or None)
 
     init_session_tree(projects_dir)
@@ -163,26 +327,38 @@ def refresh_session_tree():
     Thread-safe: uses _refresh_lock to prevent concurrent scans and
     protect _session_tree from data races.
     """
-    global _session_tree, _last_scan_time
+    global _session_tree, _last_scan_time, _tree_generation
     if _projects_dir is None:
         raise RuntimeError("Projects directory not initialized")
 
     with _refresh_lock:
         amplifier_home = _projects_dir.parent
+        previous_tree = _session_tree
 
         # Pass existing tree for incremental scanning
         _session_tree = session_scanner.scan_projects(amplifier_home, _session_tree)
         _last_scan_time = time.time()
+        # Publish the new generation only after the new tree is in place
+        _tree_generation += 1
 
-        # Log refresh with incremental stats
+        # Log refresh with incremental stats, skipping periodic refreshes
+        # that found nothing new so idle servers don't spam the service log
         scan_state = session_scanner.get_scan_state()
         project_count = len(_session_tree.projects)
         session_count = len(_session_tree.session_index)
-        print(
-            f"[Refresh] {project_count} projects, {session_count} sessions "
-            f"(scanned: {scan_state.sessions_scanned}, cached: {scan_state.sessions_cached}, "
-            f"took {scan_state.last_scan_duration:.2f}s)"
+        unchanged = (
+            previous_tree is not None
+            and scan_state.sessions_scanned == 0
+            and project_count == len(previous_tree.projects)
+            and session_count == len(previous_tree.session_index)
         )
+        if not unchanged:
+            print(
+                f"[Refresh] {project_count} projects, {session_count} sessions "
+                f"(scanned: {scan_state.sessions_scanned}, "
+                f"cached: {scan_state.sessions_cached}, "
+                f"took {scan_state.last_scan_duration:.2f}s)"
+            )
 
 
 _refresh_thread = None
@@ -218,14 +394,25 @@ def _start_background_refresh():
 
 @bp.route("/", strict_slashes=False)
 def index():
-    """Serve main HTML page."""
-    return render_template("index.html")
+    """Serve main HTML page.
+
+    The page only varies with the mount point, so it is rendered once per
+    script root and reused (except in debug mode, where templates may change).
+    """
+    rendered = current_app.extensions.setdefault("log_viewer_index", {})
+    html = rendered.get(request.script_root)
+    if html is None:
+        html = render_template("index.html")
+        if not current_app.debug:
+            rendered[request.script_root] = html
+    return html
 
 
 @bp.route("/api/status")
 def get_status():
     """Get server and scan status."""
     scan_state = session_scanner.get_scan_state()
+    tree = _session_tree
 
     return jsonify(
         {
@@ -233,8 +420,8 @@ def get_status():
             "last_scan_duration": scan_state.last_scan_duration,
             "sessions_scanned": scan_state.sessions_scanned,
             "sessions_cached": scan_state.sessions_cached,
-            "project_count": len(_session_tree.projects) if _session_tree else 0,
-            "session_count": len(_session_tree.session_index) if _session_tree else 0,
+            "project_count": len(tree.projects) if tree else 0,
+            "session_count": len(tree.session_index) if tree else 0,
             "cache_age": time.time() - _last_scan_time if _last_scan_time else 0,
             "cache_duration": _cache_duration,
         }
@@ -249,7 +436,9 @@ def get_projects():
         since: Start date - either ISO date or relative like '2d', '7d', '30d'
         until: End date - ISO date string (for custom date ranges)
     """
-    if not _session_tree:
+    generation = _tree_generation
+    tree = _session_tree
+    if not tree:
         return jsonify({"error": "Session tree not initialized"}), 500
 
     # Parse date filters
@@ -260,41 +449,33 @@ def get_projects():
 
     # Include scan status in response
     scan_state = session_scanner.get_scan_state()
-
-    # Build projects list with filtered session counts
-    projects_data = []
-    for project in _session_tree.projects:
-        # Count sessions matching date filter
-        if start_date or end_date:
-            matching_sessions = [
-                s
-                for s in project.sessions
-                if session_in_date_range(s, start_date, end_date)
-            ]
-            session_count = len(matching_sessions)
-        else:
-            session_count = len(project.sessions)
-
-        # Only include projects with sessions in the date range
-        if session_count > 0:
-            projects_data.append(
-                {
-                    "slug": project.slug,
-                    "path": str(project.path),
-                    "session_count": session_count,
-                }
-            )
-
-    response = jsonify(
-        {
-            "projects": projects_data,
-            "is_scanning": scan_state.is_scanning,
-        }
+    is_scanning = scan_state.is_scanning
+
+    def build():
+        # Build projects list with filtered session counts
+        projects_data = []
+        for project in tree.projects:
+            # Count sessions matching date filter
+            session_count = project.count_sessions_in_range(start_date, end_date)
+
+            # Only include projects with sessions in the date range
+            if session_count > 0:
+                projects_data.append(
+                    {
+                        "slug": project.slug,
+                        "path": str(project.path),
+                        "session_count": session_count,
+                    }
+                )
+        return {"projects": projects_data, "is_scanning": is_scanning}
+
+    # Relative filters ('7d') move with the clock, so only absolute ones cache
+    cache_key = (
+        None
+        if _is_relative_filter(since) or _is_relative_filter(until)
+        else ("projects", generation, since, until, is_scanning)
     )
-    response.headers["Cache-Control"] = "no-cache, no-store, must-revalidate"
-    response.headers["Pragma"] = "no-cache"
-    response.headers["Expires"] = "0"
-    return response
+    return revalidate_with_etag(cached_json(cache_key, build))
 
 
 @bp.route("/api/refresh", methods=["POST"])
@@ -329,7 +510,9 @@ def get_sessions():
     if not project_slug:
         return jsonify({"error": "Missing 'project' parameter"}), 400
 
-    if not _session_tree:
+    generation = _tree_generation
+    tree = _session_tree
+    if not tree:
         return jsonify({"error": "Session tree not initialized"}), 500
 
     # Parse date filters
@@ -339,30 +522,33 @@ def get_sessions():
     end_date = parse_date_filter(until)
 
     # Find project
-    project = next((p for p in _session_tree.projects if p.slug == project_slug), None)
+    project = session_scanner.get_project(project_slug, tree)
     if not project:
         return jsonify({"error": "Project not found"}), 404
 
-    # Filter sessions by date and build response data
-    sessions_data = [
-        {
-            "id": session.id,
-            "project_slug": session.project_slug,
-            "timestamp": session.timestamp,
-            "parent_id": session.parent_id,
-            "children": [child.id for child in session.children],
-            "name": session.name,
-            "description": session.description,
-        }
-        for session in project.sessions
-        if session_in_date_range(session, start_date, end_date)
-    ]
-
-    response = jsonify({"sessions": sessions_data})
-    response.headers["Cache-Control"] = "no-cache, no-store, must-revalidate"
-    response.headers["Pragma"] = "no-cache"
-    response.headers["Expires"] = "0"
-    return response
+    def build():
+        # Filter sessions by date and build response data
+        sessions_data = [
+            {
+                "id": session.id,
+                "project_slug": session.project_slug,
+                "timestamp": session.timestamp,
+                "parent_id": session.parent_id,
+                "children": session.child_ids,
+                "name": session.name,
+                "description": session.description,
+            }
+            for session in project.sessions_in_range(start_date, end_date)
+        ]
+        return {"sessions": sessions_data}
+
+    # Relative filters ('7d') move with the clock, so only absolute ones cache
+    cache_key = (
+        None
+        if _is_relative_filter(since) or _is_relative_filter(until)
+        else ("sessions", generation, project_slug, since, until)
+    )
+    return revalidate_with_etag(cached_json(cache_key, build))
 
 
 @bp.route("/api/events/list")
@@ -389,10 +575,11 @@ def get_event_list():
     if offset < 0 or limit < 1 or limit > 5000:
         return jsonify({"error": "Invalid offset or limit"}), 400
 
-    if not _session_tree:
+    tree = _session_tree
+    if not tree:
         return jsonify({"error": "Session tree not initialized"}), 500
 
-    session = session_scanner.get_session(session_id, _session_tree)
+    session = session_scanner.get_session(session_id, tree)
     if not session:
         return jsonify({"error": "Session not found"}), 404
 
@@ -407,10 +594,11 @@ def get_event_detail(session_id: str, line_num: int):
 
     Returns the complete event payload for display in the detail panel.
     """
-    if not _session_tree:
+    tree = _session_tree
+    if not tree:
         return jsonify({"error": "Session tree not initialized"}), 500
 
-    session = session_scanner.get_session(session_id, _session_tree)
+    session = session_scanner.get_session(session_id, tree)
     if not session:
         return jsonify({"error": "Session not found"}), 404
 
@@ -440,11 +628,12 @@ def get_events():
     if offset < 0 or limit < 1 or limit > 5000:
         return jsonify({"error": "Invalid offset or limit"}), 400
 
-    if not _session_tree:
+    tree = _session_tree
+    if not tree:
         return jsonify({"error": "Session tree not initialized"}), 500
 
     # Get session
-    session = session_scanner.get_session(session_id, _session_tree)
+    session = session_scanner.get_session(session_id, tree)
     if not session:
         return jsonify({"error": "Session not found"}), 404
 
@@ -464,22 +653,16 @@ def get_events():
 @bp.route("/api/session/<session_id>/metadata")
 def get_session_metadata(session_id: str):
     """Get session metadata."""
-    if not _session_tree:
+    tree = _session_tree
+    if not tree:
         return jsonify({"error": "Session tree not initialized"}), 500
 
-    session = session_scanner.get_session(session_id, _session_tree)
+    session = session_scanner.get_session(session_id, tree)
     if not session:
         return jsonify({"error": "Session not found"}), 404
 
-    # Read context from metadata file on demand (not stored in memory)
-    context = {}
-    metadata_path = session.events_path.parent / "metadata.json"
-    if metadata_path.exists():
-        try:
-            with open(metadata_path, encoding="utf-8") as f:
-                context = json.load(f).get("context", {})
-        except (json.JSONDecodeError, OSError):
-            pass
+    # Read context from metadata file on demand (not stored in the tree)
+    context = _read_metadata_context(session.events_path.parent / "metadata.json")
 
     return jsonify(
         {
@@ -491,6 +674,39 @@ def get_session_metadata(session_id: str):
     )
 
 
+def _read_metadata_context(metadata_path: Path) -> dict:
+    """Read the "context" of a metadata.json, re-parsing only when it changes.
+
+    Args:
+        metadata_path: Path to a session's metadata.json
+
+    Returns:
+        The context dict, or {} if the file is missing or unreadable
+    """
+    try:
+        st = metadata_path.stat()
+    except OSError:
+        return {}  # Missing or unreadable metadata — no context
+
+    with _metadata_lock:
+        cached = _metadata_cache.get(metadata_path)
+    if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+        return cached[2]
+
+    try:
+        with open(metadata_path, "rb") as f:
+            context = _loads(f.read()).get("context", {})
+    except (json.JSONDecodeError, OSError):
+        return {}
+
+    with _metadata_lock:
+        _metadata_cache[metadata_path] = (st.st_mtime_ns, st.st_size, context)
+        _metadata_cache.move_to_end(metadata_path)
+        while len(_metadata_cache) > _METADATA_CACHE_MAX:
+            _metadata_cache.popitem(last=False)
+    return context
+
+
 @bp.route("/api/events/since")
 def get_events_since():
     """Poll for new events since a given byte position.
@@ -511,10 +727,11 @@ def get_events_since():
     last_position = request.args.get("position", 0, type=int)
     last_line_count = request.args.get("line_count", 0, type=int)
 
-    if not _session_tree:
+    tree = _session_tree
+    if not tree:
         return jsonify({"error": "Session tree not initialized"}), 500
 
-    session = session_scanner.get_session(session_id, _session_tree)
+    session = session_scanner.get_session(session_id, tree)
     if not session:
         return jsonify({"error": "Session not found"}), 404
 
@@ -531,14 +748,20 @@ def get_events_since():
     )
 
 
-def run_server(projects_dir: Path, port: int = 8180):
+def run_server(projects_dir: Path, port: int = 8180, threads: int = 8):
     """
-    Start Flask server with automatic port selection if requested port is in use.
+    Start the server with automatic port selection if requested port is in use.
+
+    Serves through waitress (the same WSGI server as ``amplifier-log-viewer
+    serve``) rather than Flask's development server.
 
     Args:
         projects_dir: Path to ~/.amplifier/projects directory
         port: Port to run server on (will try next ports if in use)
+        threads: Number of waitress worker threads
     """
+    from waitress import create_server
+
     print(f"Initializing session tree from {projects_dir}")
     app = create_app(projects_dir)
 
@@ -553,10 +776,10 @@ def run_server(projects_dir: Path, port: int = 8180):
     for attempt in range(max_attempts):
         try_port = port + attempt
         try:
-            print(f"Starting server on http://localhost:{try_port}")
-            print("Press Ctrl+C to stop")
-            app.run(host="127.0.0.1", port=try_port, debug=False)
-            break
+            # Binding happens here, so a busy port fails before serving starts
+            server = create_server(
+                app, host="127.0.0.1", port=try_port, threads=threads
+            )
         except OSError as e:
             if "Address already in use" in str(e):
                 if attempt < max_attempts - 1:
@@ -566,3 +789,8 @@ def run_server(projects_dir: Path, port: int = 8180):
                 print("Try a different port with: amplifier-log-viewer --port <PORT>")
                 raise SystemExit(1) from e
             raise
+
+        print(f"Starting server on http://localhost:{try_port}")
+        print("Press Ctrl+C to stop")
+        server.run()
+        break
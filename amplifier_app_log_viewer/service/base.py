@@ -1,9 +1,11 @@
 """Base service manager interface."""
 
 import platform
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 
 
@@ -128,36 +130,70 @@ class ServiceManager(ABC):
         """
         ...
 
+    def _wait_for_running(self, timeout: float = 1.0) -> ServiceInfo:
+        """Poll status() with backoff until the service reports running.
+
+        Args:
+            timeout: Maximum seconds to wait before giving up
+
+        Returns:
+            The first RUNNING status, or the last status seen at the deadline
+        """
+        deadline = time.monotonic() + timeout
+        delay = 0.005
+        while True:
+            info = self.status()
+            remaining = deadline - time.monotonic()
+            if info.status == ServiceStatus.RUNNING or remaining <= 0:
+                return info
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, 0.2)
+
     def _find_executable(self) -> Path:
         """Find the amplifier-log-viewer executable.
 
         Returns:
             Path to the executable
         """
-        import shutil
-        import sys
-
-        # Try to find via which
-        exe = shutil.which("amplifier-log-viewer")
-        if exe:
-            return Path(exe).resolve()
-
-        # Fall back to common uv tool location
-        uv_path = Path.home() / ".local" / "bin" / "amplifier-log-viewer"
-        if uv_path.exists():
-            return uv_path
-
-        # Last resort: derive from current Python
-        # This works when running via `uv run` or in a venv
-        python_dir = Path(sys.executable).parent
-        candidate = python_dir / "amplifier-log-viewer"
-        if candidate.exists():
-            return candidate
-
-        raise FileNotFoundError(
-            "Could not find amplifier-log-viewer executable. "
-            "Make sure it's installed via 'uv tool install' or 'pip install'."
-        )
+        return _find_executable()
+
+
+@lru_cache(maxsize=1)
+def _find_executable() -> Path:
+    """Find the amplifier-log-viewer executable.
+
+    The result is cached for the lifetime of the process; a failed lookup
+    is not cached, so a later call can still find a fresh install.
+
+    Returns:
+        Absolute path to the executable, so the service file can launch it
+        directly (systemd requires this, and it keeps launchd from needing a
+        shell to search PATH)
+    """
+    import shutil
+    import sys
+
+    # Try to find via which
+    exe = shutil.which("amplifier-log-viewer")
+    if exe:
+        return Path(exe).resolve()
+
+    # Fall back to common uv tool location
+    uv_path = Path.home() / ".local" / "bin" / "amplifier-log-viewer"
+    if uv_path.exists():
+        return uv_path.absolute()
+
+    # Last resort: derive from current Python
+    # This works when running via `uv run` or in a venv
+    python_dir = Path(sys.executable).parent
+    candidate = python_dir / "amplifier-log-viewer"
+    if candidate.exists():
+        return candidate.absolute()
+
+    raise FileNotFoundError(
+        "Could not find amplifier-log-viewer executable. "
+        "Make sure it's installed via 'uv tool install' or 'pip install'."
+    )
 
 
 def get_service_manager(
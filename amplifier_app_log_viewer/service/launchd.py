@@ -1,7 +1,7 @@
 """Launchd service management for macOS."""
 
 import os
-import plistlib
+import re
 import subprocess
 from pathlib import Path
 
@@ -9,6 +9,10 @@ from .base import ServiceInfo, ServiceManager, ServiceStatus
 
 LAUNCHD_LABEL = "com.amplifier.log-viewer"
 
+# Fields of the record printed by `launchctl list <label>`, e.g. '"PID" = 123;'
+_PID_RE = re.compile(r'"PID"\s*=\s*(\d+);')
+_LAST_EXIT_STATUS_RE = re.compile(r'"LastExitStatus"\s*=\s*(-?\d+);')
+
 
 class LaunchdServiceManager(ServiceManager):
     """Launchd-based service manager for macOS."""
@@ -46,11 +50,21 @@ class LaunchdServiceManager(ServiceManager):
         return f"{self._get_domain_target()}/{self.label}"
 
     def _run_launchctl(
-        self, *args: str, check: bool = False
+        self, *args: str, check: bool = False, capture: bool = True
     ) -> subprocess.CompletedProcess:
-        """Run a launchctl command."""
+        """Run a launchctl command.
+
+        Args:
+            args: Arguments to pass to launchctl
+            check: Raise CalledProcessError on a nonzero exit
+            capture: Capture stdout; pass False when only the exit code and
+                stderr matter, and stdout is discarded instead
+        """
         cmd = ["launchctl", *args]
-        return subprocess.run(cmd, capture_output=True, text=True, check=check)
+        stdout = subprocess.PIPE if capture else subprocess.DEVNULL
+        return subprocess.run(
+            cmd, stdout=stdout, stderr=subprocess.PIPE, text=True, check=check
+        )
 
     def _generate_plist(self, executable: Path) -> dict:
         """Generate the launchd plist configuration."""
@@ -84,12 +98,16 @@ class LaunchdServiceManager(ServiceManager):
             },
             "StandardOutPath": str(self.log_file_path),
             "StandardErrorPath": str(self.error_log_path),
-            "ProcessType": "Background",
-            "LowPriorityIO": True,
+            # Serves requests from the user's browser, so don't let launchd
+            # apply Background CPU and I/O throttling
+            "ProcessType": "Interactive",
         }
 
     def install(self) -> ServiceInfo:
         """Install the launchd LaunchAgent."""
+        # plistlib pulls in xml.parsers.expat; only install needs it
+        import plistlib
+
         try:
             executable = self._find_executable()
         except FileNotFoundError as e:
@@ -130,7 +148,9 @@ class LaunchdServiceManager(ServiceManager):
     def uninstall(self) -> ServiceInfo:
         """Uninstall the launchd LaunchAgent."""
         # Bootout (unload) the service first
-        self._run_launchctl("bootout", self._get_service_target(), check=False)
+        self._run_launchctl(
+            "bootout", self._get_service_target(), check=False, capture=False
+        )
 
         # Remove plist file
         if self.service_file_path.exists():
@@ -155,6 +175,7 @@ class LaunchdServiceManager(ServiceManager):
             self._get_domain_target(),
             str(self.service_file_path),
             check=False,
+            capture=False,
         )
 
         # If already bootstrapped, try kickstart instead
@@ -169,6 +190,7 @@ class LaunchdServiceManager(ServiceManager):
                     "-k",  # Kill existing if running
                     self._get_service_target(),
                     check=False,
+                    capture=False,
                 )
             elif "could not find" not in result.stderr.lower():
                 return ServiceInfo(
@@ -176,12 +198,8 @@ class LaunchdServiceManager(ServiceManager):
                     message=f"Failed to start service: {result.stderr}",
                 )
 
-        # Give it a moment to start
-        import time
-
-        time.sleep(1)
-
-        return self.status()
+        # Return as soon as launchd reports a PID rather than sleeping blindly
+        return self._wait_for_running()
 
     def stop(self) -> ServiceInfo:
         """Stop the launchd service."""
@@ -197,11 +215,14 @@ class LaunchdServiceManager(ServiceManager):
             "SIGTERM",
             self._get_service_target(),
             check=False,
+            capture=False,
         )
 
         if result.returncode != 0 and "no such process" not in result.stderr.lower():
             # Try bootout as fallback
-            self._run_launchctl("bootout", self._get_service_target(), check=False)
+            self._run_launchctl(
+                "bootout", self._get_service_target(), check=False, capture=False
+            )
 
         return ServiceInfo(
             status=ServiceStatus.STOPPED,
@@ -217,34 +238,11 @@ class LaunchdServiceManager(ServiceManager):
                 message="Service not installed.",
             )
 
-        # Get service info using launchctl list
-        result = self._run_launchctl("list", check=False)
+        # Ask launchctl about our job only. A nonzero exit means the job is
+        # not loaded; otherwise it prints a single old-style plist record.
+        result = self._run_launchctl("list", self.label, check=False)
 
         if result.returncode != 0:
-            return ServiceInfo(
-                status=ServiceStatus.UNKNOWN,
-                service_file=self.service_file_path,
-                message=f"Could not get status: {result.stderr}",
-            )
-
-        # Parse the output to find our service
-        # Format: PID\tStatus\tLabel
-        pid = None
-        exit_code = None
-        found = False
-
-        for line in result.stdout.strip().split("\n"):
-            if self.label in line:
-                found = True
-                parts = line.split("\t")
-                if len(parts) >= 2:
-                    pid_str = parts[0].strip()
-                    exit_str = parts[1].strip()
-                    pid = int(pid_str) if pid_str and pid_str != "-" else None
-                    exit_code = int(exit_str) if exit_str and exit_str != "-" else None
-                break
-
-        if not found:
             # Service is installed but not loaded
             return ServiceInfo(
                 status=ServiceStatus.STOPPED,
@@ -252,6 +250,19 @@ class LaunchdServiceManager(ServiceManager):
                 message="Service installed but not loaded.",
             )
 
+        pid_match = _PID_RE.search(result.stdout)
+        pid = int(pid_match.group(1)) if pid_match else None
+
+        exit_code = None
+        exit_match = _LAST_EXIT_STATUS_RE.search(result.stdout)
+        if exit_match:
+            # LastExitStatus is a raw wait status (e.g. 256 for exit code 1)
+            exit_code = int(exit_match.group(1))
+            try:
+                exit_code = os.waitstatus_to_exitcode(exit_code)
+            except ValueError:
+                pass  # Not a valid wait status; report it as-is
+
         if pid is not None and pid > 0:
             status = ServiceStatus.RUNNING
             message = f"PID: {pid}\nURL: http://localhost:{self.port}"
@@ -285,12 +296,10 @@ class LaunchdServiceManager(ServiceManager):
         else:
             # Just show last N lines
             cmd = ["tail", "-n", str(lines), str(self.log_file_path)]
-            subprocess.run(cmd, check=False)
 
-            # Also show error log if it exists and has content
+            # Also show error log if it exists and has content; tail prints
+            # a "==> file <==" header before each file when given several
             if self.error_log_path.exists() and self.error_log_path.stat().st_size > 0:
-                print(f"\n--- Error log ({self.error_log_path}) ---")
-                subprocess.run(
-                    ["tail", "-n", str(lines), str(self.error_log_path)],
-                    check=False,
-                )
+                cmd.append(str(self.error_log_path))
+
+            subprocess.run(cmd, check=False)
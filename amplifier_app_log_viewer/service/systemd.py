@@ -1,6 +1,8 @@
 """Systemd service management for Linux/WSL."""
 
 import os
+import re
+import shutil
 import subprocess
 from pathlib import Path
 
@@ -26,10 +28,18 @@ MemoryMax=4G
 WantedBy=default.target
 """
 
+# Pieces of the installed unit that status() reports back
+_EXEC_START_RE = re.compile(r"^ExecStart=(.*)$", re.MULTILINE)
+_HOST_ARG_RE = re.compile(r"--host\s+(\S+)")
+_PORT_ARG_RE = re.compile(r"--port\s+(\d+)")
+
 
 class SystemdServiceManager(ServiceManager):
     """Systemd-based service manager for Linux/WSL."""
 
+    # Set once _check_systemd_available() has passed in this process
+    _systemd_checked = False
+
     @property
     def platform_name(self) -> str:
         return "systemd"
@@ -50,29 +60,39 @@ class SystemdServiceManager(ServiceManager):
         return Path("/dev/null")
 
     def _run_systemctl(
-        self, *args: str, check: bool = True
+        self, *args: str, check: bool = True, capture: bool = True
     ) -> subprocess.CompletedProcess:
-        """Run a systemctl --user command."""
+        """Run a systemctl --user command.
+
+        Args:
+            args: Arguments to pass to systemctl --user
+            check: Raise CalledProcessError on a nonzero exit
+            capture: Capture stdout; pass False when only the exit code and
+                stderr matter, and stdout is discarded instead
+        """
         cmd = ["systemctl", "--user", *args]
-        return subprocess.run(cmd, capture_output=True, text=True, check=check)
+        stdout = subprocess.PIPE if capture else subprocess.DEVNULL
+        return subprocess.run(
+            cmd, stdout=stdout, stderr=subprocess.PIPE, text=True, check=check
+        )
 
     def _daemon_reload(self) -> None:
         """Reload systemd daemon to pick up changes."""
-        self._run_systemctl("daemon-reload", check=False)
+        self._run_systemctl("daemon-reload", check=False, capture=False)
 
     def _check_systemd_available(self) -> None:
         """Check if systemd is available and running."""
+        if SystemdServiceManager._systemd_checked:
+            return
+
         # Check if systemctl exists
-        result = subprocess.run(
-            ["which", "systemctl"], capture_output=True, text=True, check=False
-        )
-        if result.returncode != 0:
+        if shutil.which("systemctl") is None:
             raise RuntimeError(
                 "systemctl not found. systemd is required for service mode on Linux."
             )
 
         # Check if user session is available
-        result = self._run_systemctl("--version", check=False)
+        result = self._run_systemctl("--version", check=False, capture=False)
         if result.returncode != 0:
             raise RuntimeError(
                 "systemd user session not available. "
@@ -82,6 +102,8 @@ class SystemdServiceManager(ServiceManager):
                 "Then restart WSL with: wsl --shutdown"
             )
 
+        SystemdServiceManager._systemd_checked = True
+
     def install(self) -> ServiceInfo:
         """Install the systemd user service."""
         self._check_systemd_available()
@@ -108,14 +130,22 @@ class SystemdServiceManager(ServiceManager):
             home=Path.home(),
         )
 
-        # Write service file
-        self.service_file_path.write_text(content)
-
-        # Reload systemd
-        self._daemon_reload()
+        # Write service file, reloading systemd only if the unit changed
+        try:
+            unchanged = self.service_file_path.read_text() == content
+        except OSError:
+            unchanged = False
+        if not unchanged:
+            # Write beside the unit and rename so systemd never sees a partial file
+            tmp_path = self.service_file_path.with_suffix(".service.tmp")
+            tmp_path.write_text(content)
+            os.replace(tmp_path, self.service_file_path)
+            self._daemon_reload()
 
         # Enable the service (but don't start yet)
-        self._run_systemctl("enable", f"{self.SERVICE_NAME}.service", check=False)
+        self._run_systemctl(
+            "enable", f"{self.SERVICE_NAME}.service", check=False, capture=False
+        )
 
         return ServiceInfo(
             status=ServiceStatus.STOPPED,
@@ -134,11 +164,14 @@ class SystemdServiceManager(ServiceManager):
 
     def uninstall(self) -> ServiceInfo:
         """Uninstall the systemd user service."""
-        # Stop the service first
-        self._run_systemctl("stop", f"{self.SERVICE_NAME}.service", check=False)
-
-        # Disable the service
-        self._run_systemctl("disable", f"{self.SERVICE_NAME}.service", check=False)
+        # Stop and disable the service in one call
+        self._run_systemctl(
+            "disable",
+            "--now",
+            f"{self.SERVICE_NAME}.service",
+            check=False,
+            capture=False,
+        )
 
         # Remove service file
         if self.service_file_path.exists():
@@ -161,7 +194,7 @@ class SystemdServiceManager(ServiceManager):
             )
 
         result = self._run_systemctl(
-            "start", f"{self.SERVICE_NAME}.service", check=False
+            "start", f"{self.SERVICE_NAME}.service", check=False, capture=False
         )
 
         if result.returncode != 0:
@@ -170,8 +203,8 @@ class SystemdServiceManager(ServiceManager):
                 message=f"Failed to start service: {result.stderr}",
             )
 
-        # Get status to confirm and get PID
-        return self.status()
+        # Get status to confirm and get PID (polls while still "activating")
+        return self._wait_for_running()
 
     def stop(self) -> ServiceInfo:
         """Stop the systemd service."""
@@ -182,7 +215,7 @@ class SystemdServiceManager(ServiceManager):
             )
 
         result = self._run_systemctl(
-            "stop", f"{self.SERVICE_NAME}.service", check=False
+            "stop", f"{self.SERVICE_NAME}.service", check=False, capture=False
         )
 
         if result.returncode != 0:
@@ -205,26 +238,21 @@ class SystemdServiceManager(ServiceManager):
         host = "127.0.0.1"
         port = 8180
 
-        if not self.service_file_path.exists():
-            return host, port
-
         try:
             content = self.service_file_path.read_text()
-            for line in content.split("\n"):
-                if line.startswith("ExecStart="):
-                    # Parse --host and --port from ExecStart line
-                    import re
-
-                    host_match = re.search(r"--host\s+(\S+)", line)
-                    if host_match:
-                        host = host_match.group(1)
-
-                    port_match = re.search(r"--port\s+(\d+)", line)
-                    if port_match:
-                        port = int(port_match.group(1))
-                    break
         except OSError:
-            pass
+            return host, port
+
+        # Parse --host and --port from the ExecStart line
+        exec_match = _EXEC_START_RE.search(content)
+        if exec_match:
+            exec_start = exec_match.group(1)
+            host_match = _HOST_ARG_RE.search(exec_start)
+            if host_match:
+                host = host_match.group(1)
+            port_match = _PORT_ARG_RE.search(exec_start)
+            if port_match:
+                port = int(port_match.group(1))
 
         return host, port
 
@@ -256,11 +284,9 @@ class SystemdServiceManager(ServiceManager):
             )
 
         # Parse properties
-        props = {}
-        for line in result.stdout.strip().split("\n"):
-            if "=" in line:
-                key, value = line.split("=", 1)
-                props[key] = value
+        props = dict(
+            line.split("=", 1) for line in result.stdout.splitlines() if "=" in line
+        )
 
         active_state = props.get("ActiveState", "unknown")
         main_pid = props.get("MainPID", "0")
@@ -1,14 +1,28 @@
 """Session discovery and hierarchy building with incremental scanning."""
 
 import json
+import os
+import sys
 import time
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from functools import cached_property
 from pathlib import Path
 
+from .fastjson import loads as _loads
 
-@dataclass
+# Marks a Session whose timestamp has not been parsed yet
+_UNPARSED = object()
+
+
+@dataclass(slots=True)
 class Session:
-    """Session metadata."""
+    """Session metadata.
+
+    Slotted: the tree holds one per session on disk, often tens of thousands.
+    """
 
     id: str
     project_slug: str
@@ -22,6 +36,38 @@ class Session:
     status: str | None = None
     bundle: str | None = None
     labels: list | None = None
+    # IDs of children, filled in with the parent-child links on each scan
+    child_ids: tuple[str, ...] = ()
+    # Backing slot for timestamp_dt (cached_property needs an instance dict)
+    _timestamp_dt: object = field(
+        default=_UNPARSED, init=False, repr=False, compare=False
+    )
+
+    @property
+    def timestamp_dt(self) -> datetime | None:
+        """Parsed timestamp (UTC if it has no offset), or None if missing/invalid.
+
+        Parsed once per Session; a rescan that re-reads metadata creates a new
+        Session, so the cached value never outlives the timestamp it came from.
+        """
+        dt = self._timestamp_dt
+        if dt is _UNPARSED:
+            dt = self._timestamp_dt = _parse_timestamp(self.timestamp)
+        return dt
+
+
+def _parse_timestamp(timestamp: str) -> datetime | None:
+    """Parse an ISO timestamp, treating naive values as UTC."""
+    if not timestamp:
+        return None
+    try:
+        # 3.11+ accepts a trailing "Z" natively
+        dt = datetime.fromisoformat(timestamp)
+    except (ValueError, TypeError):
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt
 
 
 @dataclass
@@ -32,22 +78,66 @@ class Project:
     path: Path
     sessions: list[Session]
 
+    @cached_property
+    def _sessions_by_time(self) -> tuple[list[datetime], list[Session]]:
+        """Timestamped sessions sorted by time, with their sort keys.
 
-@dataclass
+        Built on first date-filtered query; a project's sessions are fixed once
+        the scan creates it (each rescan builds new Project objects).
+        """
+        dated = sorted(
+            (s for s in self.sessions if s.timestamp_dt is not None),
+            key=lambda s: s.timestamp_dt,
+        )
+        return [s.timestamp_dt for s in dated], dated
+
+    def _time_slice(
+        self, start: datetime | None, end: datetime | None
+    ) -> list[Session]:
+        """Timestamped sessions within [start, end], in time order."""
+        keys, dated = self._sessions_by_time
+        lo = bisect_left(keys, start) if start else 0
+        hi = bisect_right(keys, end) if end else len(keys)
+        return dated[lo:hi]
+
+    def sessions_in_range(
+        self, start: datetime | None, end: datetime | None = None
+    ) -> list[Session]:
+        """Sessions with a timestamp within [start, end], in session ID order.
+
+        With no bounds, all sessions are returned. Otherwise sessions without
+        a valid timestamp are excluded.
+        """
+        if start is None and end is None:
+            return self.sessions
+        return sorted(self._time_slice(start, end), key=lambda s: s.id)
+
+    def count_sessions_in_range(
+        self, start: datetime | None, end: datetime | None = None
+    ) -> int:
+        """Number of sessions sessions_in_range() would return."""
+        if start is None and end is None:
+            return len(self.sessions)
+        return len(self._time_slice(start, end))
+
+
+@dataclass(slots=True)
 class SessionTree:
     """Complete session tree."""
 
     projects: list[Project]
     session_index: dict[str, Session]
+    projects_by_slug: dict[str, Project] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class ScanState:
     """State for incremental scanning."""
 
-    # mtime tracking for incremental updates
-    project_mtimes: dict[str, float] = field(default_factory=dict)
-    session_mtimes: dict[str, float] = field(default_factory=dict)
+    # mtime tracking for incremental updates (integer st_mtime_ns, so
+    # comparisons are exact rather than subject to float rounding)
+    project_mtimes: dict[str, int] = field(default_factory=dict)
+    session_mtimes: dict[str, int] = field(default_factory=dict)
 
     # Scan status
     is_scanning: bool = False
@@ -65,6 +155,68 @@ def get_scan_state() -> ScanState:
     return _scan_state
 
 
+# Below this many metadata reads a scan stays on the calling thread
+_PARALLEL_READ_MIN = 64
+_READ_BATCH_SIZE = 64
+
+_read_pool: ThreadPoolExecutor | None = None
+
+
+def _get_read_pool() -> ThreadPoolExecutor:
+    """Return the metadata read pool, created on first use and kept for reuse."""
+    global _read_pool
+    if _read_pool is None:
+        _read_pool = ThreadPoolExecutor(
+            max_workers=min(32, (os.cpu_count() or 1) * 4),
+            thread_name_prefix="metadata-read",
+        )
+    return _read_pool
+
+
+def _read_session(session_id: str, project_slug: str, session_path: str) -> Session:
+    """Build a Session from its directory, reading only metadata.json.
+
+    Args:
+        session_id: Session directory name
+        project_slug: Slug of the owning project
+        session_path: Path to the session directory
+
+    Returns:
+        Session populated from metadata.json (fallback values if it is missing
+        or unreadable)
+    """
+    session_dir = Path(session_path)
+
+    # Parse metadata — extract only the fields we need
+    raw = {}
+    try:
+        with open(os.path.join(session_path, "metadata.json"), "rb") as f:
+            raw = _loads(f.read())
+    except (json.JSONDecodeError, OSError):
+        # Missing or unreadable metadata — use fallback values
+        pass
+
+    return Session(
+        id=session_id,
+        project_slug=project_slug,
+        timestamp=raw.get("created", ""),
+        parent_id=raw.get("parent_session_id"),
+        children=[],
+        events_path=session_dir / "events.jsonl",
+        transcript_path=session_dir / "transcript.jsonl",
+        name=raw.get("name"),
+        description=raw.get("description"),
+        status=raw.get("status"),
+        bundle=raw.get("bundle"),
+        labels=raw.get("labels"),
+    )
+
+
+def _read_sessions(batch: list[tuple[str, str, str]]) -> list[Session]:
+    """Read a batch of (session_id, project_slug, session_path) entries."""
+    return [_read_session(*args) for args in batch]
+
+
 def scan_projects(
     amplifier_home: Path | None = None,
     existing_tree: SessionTree | None = None,
@@ -97,13 +249,21 @@ def scan_projects(
             amplifier_home = Path.home() / ".amplifier"
         projects_dir = amplifier_home / "projects"
 
-        # Return empty tree if projects directory doesn't exist yet
-        if not projects_dir.exists():
+        # Directory entries come from scandir, which reports each entry's type
+        # from the directory listing itself; only the mtimes we compare need
+        # a stat call.
+        try:
+            with os.scandir(projects_dir) as entries:
+                project_entries = sorted(entries, key=lambda e: e.name)
+        except (FileNotFoundError, NotADirectoryError):
+            # Return empty tree if projects directory doesn't exist yet
             return SessionTree(projects=[], session_index={})
 
-        # Compute age cutoff for recency filtering
+        # Compute age cutoff for recency filtering (in ns, like the mtimes)
         age_cutoff = (
-            time.time() - (max_age_days * 86400) if max_age_days is not None else None
+            time.time_ns() - max_age_days * 86400 * 10**9
+            if max_age_days is not None
+            else None
         )
 
         # Reuse existing tree's index by reference (read-only lookup, no copy needed)
@@ -111,38 +271,44 @@ def scan_projects(
             existing_tree.session_index if existing_tree else {}
         )
 
-        projects = []
-        session_index = {}
+        # First pass: walk the directories, reusing unchanged sessions and
+        # queueing the rest for a metadata read. Each project's entries hold
+        # either a reused Session or an index into to_read.
+        scanned_projects: list[tuple[str, str, int, list[Session | int]]] = []
+        to_read: list[tuple[str, str, str]] = []
+        to_read_inodes: list[int] = []
 
         # Scan each project directory
-        for project_dir in sorted(projects_dir.iterdir()):
-            if not project_dir.is_dir():
+        for project_entry in project_entries:
+            if not project_entry.is_dir():
                 continue
 
-            project_slug = project_dir.name
-            sessions_dir = project_dir / "sessions"
+            # Interned so every Session of a project, across rescans, shares
+            # one slug string
+            project_slug = sys.intern(project_entry.name)
+            # Plain strings for the syscalls; Path only for the stored field
+            sessions_dir = os.path.join(project_entry.path, "sessions")
 
-            if not sessions_dir.exists():
-                continue
-
-            # Check if project directory has been modified
+            # Check if project directory has been modified (skipping projects
+            # without a readable sessions directory)
             try:
-                project_mtime = sessions_dir.stat().st_mtime
+                project_mtime = os.stat(sessions_dir).st_mtime_ns
+                session_entries = list(os.scandir(sessions_dir))
             except OSError:
                 continue
 
-            project_sessions = []
+            entries: list[Session | int] = []
 
             # Scan sessions for this project
-            for session_dir in sessions_dir.iterdir():
-                if not session_dir.is_dir():
+            for session_entry in session_entries:
+                if not session_entry.is_dir():
                     continue
 
-                session_id = session_dir.name
+                session_id = session_entry.name
 
                 # Check if we can reuse existing session data
                 try:
-                    session_mtime = session_dir.stat().st_mtime
+                    session_mtime = session_entry.stat().st_mtime_ns
                 except OSError:
                     continue
 
@@ -159,63 +325,55 @@ def scan_projects(
                     and session_id in existing_sessions
                 ):
                     session = existing_sessions[session_id]
-                    # Reset children (will rebuild relationships later)
-                    session.children = []
-                    project_sessions.append(session)
-                    session_index[session_id] = session
+                    entries.append(session)
                     _scan_state.sessions_cached += 1
                     continue
 
                 # Need to read metadata for this session
                 _scan_state.sessions_scanned += 1
                 _scan_state.session_mtimes[session_id] = session_mtime
+                entries.append(len(to_read))
+                to_read.append((session_id, project_slug, session_entry.path))
+                to_read_inodes.append(session_entry.inode())
+
+            scanned_projects.append(
+                (project_slug, project_entry.path, project_mtime, entries)
+            )
 
-                metadata_path = session_dir / "metadata.json"
-                events_path = session_dir / "events.jsonl"
-                transcript_path = session_dir / "transcript.jsonl"
-
-                # Parse metadata — extract only the fields we need
-                parent_id = None
-                timestamp = ""
-                name = None
-                description = None
-                status = None
-                bundle = None
-                labels = None
-
-                if metadata_path.exists():
-                    try:
-                        with open(metadata_path, encoding="utf-8") as f:
-                            raw = json.load(f)
-                            parent_id = raw.get("parent_session_id")
-                            timestamp = raw.get("created", "")
-                            name = raw.get("name")
-                            description = raw.get("description")
-                            status = raw.get("status")
-                            bundle = raw.get("bundle")
-                            labels = raw.get("labels")
-                    except (json.JSONDecodeError, OSError):
-                        # Use fallback values
-                        pass
-
-                # Create session object
-                session = Session(
-                    id=session_id,
-                    project_slug=project_slug,
-                    timestamp=timestamp,
-                    parent_id=parent_id,
-                    children=[],
-                    events_path=events_path,
-                    transcript_path=transcript_path,
-                    name=name,
-                    description=description,
-                    status=status,
-                    bundle=bundle,
-                    labels=labels,
-                )
-
-                project_sessions.append(session)
-                session_index[session_id] = session
+        # Issue reads in inode order (free from the directory listing), which
+        # on ext4 and similar filesystems roughly follows on-disk layout and
+        # cuts seeking on cold caches; results are put back in scan order.
+        read_order = sorted(range(len(to_read)), key=to_read_inodes.__getitem__)
+        ordered = [to_read[i] for i in read_order]
+
+        # Metadata reads are dominated by open/read latency rather than CPU,
+        # so a large batch (first scan, or many new sessions) is overlapped
+        # on a thread pool; a typical incremental scan reads a handful inline.
+        if len(ordered) >= _PARALLEL_READ_MIN:
+            # Hand each worker a batch to keep per-task overhead negligible
+            batches = [
+                ordered[i : i + _READ_BATCH_SIZE]
+                for i in range(0, len(ordered), _READ_BATCH_SIZE)
+            ]
+            results = [
+                session
+                for batch in _get_read_pool().map(_read_sessions, batches)
+                for session in batch
+            ]
+        else:
+            results = _read_sessions(ordered)
+
+        fresh = dict(zip(read_order, results))
+
+        # Second pass: assemble projects in directory order
+        projects = []
+        session_index = {}
+        for project_slug, project_dir, project_mtime, entries in scanned_projects:
+            project_sessions = [
+                fresh[entry] if isinstance(entry, int) else entry for entry in entries
+            ]
+            for session in project_sessions:
+                session_index[session.id] = session
 
             # Sort sessions by session ID (client can re-sort as needed)
             project_sessions.sort(key=lambda s: s.id)
@@ -223,7 +381,7 @@ def scan_projects(
             # Create project object
             project = Project(
                 slug=project_slug,
-                path=project_dir,
+                path=Path(project_dir),
                 sessions=project_sessions,
             )
             projects.append(project)
@@ -231,11 +389,23 @@ def scan_projects(
             # Update project mtime
             _scan_state.project_mtimes[project_slug] = project_mtime
 
-        # Build parent-child relationships
+        # Build parent-child relationships. Each session gets a complete new
+        # children list in one assignment, so reused sessions that the
+        # previous tree still serves never expose a half-built list.
+        children_map: dict[str, list[Session]] = {}
         for session in session_index.values():
             if session.parent_id and session.parent_id in session_index:
-                parent = session_index[session.parent_id]
-                parent.children.append(session)
+                children_map.setdefault(session.parent_id, []).append(session)
+        for project in projects:
+            for session in project.sessions:
+                # A session ID reused in another project is indexed only once;
+                # the shadowed copy gets no children rather than a shared list
+                if session_index[session.id] is session:
+                    children = children_map.get(session.id, [])
+                else:
+                    children = []
+                session.children = children
+                session.child_ids = tuple(child.id for child in children)
 
         # Prune stale entries from scan state (directories that no longer exist)
         live_session_ids = set(session_index.keys())
@@ -247,7 +417,11 @@ def scan_projects(
             if slug not in live_project_slugs:
                 del _scan_state.project_mtimes[slug]
 
-        return SessionTree(projects=projects, session_index=session_index)
+        return SessionTree(
+            projects=projects,
+            session_index=session_index,
+            projects_by_slug={p.slug: p for p in projects},
+        )
 
     finally:
         _scan_state.is_scanning = False
@@ -259,6 +433,11 @@ def get_session(session_id: str, tree: SessionTree) -> Session | None:
     return tree.session_index.get(session_id)
 
 
+def get_project(project_slug: str, tree: SessionTree) -> Project | None:
+    """Fast lookup via projects_by_slug."""
+    return tree.projects_by_slug.get(project_slug)
+
+
 def get_session_hierarchy(session_id: str, tree: SessionTree) -> list[Session]:
     """
     Get session ancestry: [root, ..., parent, session].
@@ -277,14 +456,17 @@ def get_session_hierarchy(session_id: str, tree: SessionTree) -> list[Session]:
         return []
 
     hierarchy = [session]
+    seen = {session.id}
 
-    # Walk up to root
+    # Walk up to root (stopping if corrupt metadata forms a parent cycle)
     current = session
-    while current.parent_id:
+    while current.parent_id and current.parent_id not in seen:
         parent = get_session(current.parent_id, tree)
         if not parent:
             break
-        hierarchy.insert(0, parent)
+        hierarchy.append(parent)
+        seen.add(parent.id)
         current = parent
 
+    hierarchy.reverse()
     return hierarchy
@@ -53,6 +53,43 @@ def test_read_events_missing_file():
     assert total == 0
 
 
+def test_read_events_total_without_trailing_newline(tmp_path):
+    """Test that an unterminated final line is included in the total."""
+    events_file = tmp_path / "partial.jsonl"
+    events_file.write_text(
+        "\n".join(json.dumps({"event": f"test_{i}"}) for i in range(5)),
+        encoding="utf-8",
+    )
+
+    events, total = log_reader.read_events(events_file, offset=0, limit=2)
+
+    assert len(events) == 2
+    assert total == 5
+
+
+def test_non_finite_and_big_int_events_are_not_dropped(tmp_path):
+    """Test stdlib-valid JSON that orjson rejects (NaN, >64-bit ints) is kept."""
+    events_file = tmp_path / "events.jsonl"
+    events_file.write_text(
+        '{"ts":"t","event":"llm:response","data":{"cost":NaN}}\n'
+        '{"ts":"t","event":"tool:post","data":{"id":123456789012345678901234}}\n',
+        encoding="utf-8",
+    )
+
+    result = log_reader.read_event_list(events_file)
+    assert [e["event"] for e in result["events"]] == ["llm:response", "tool:post"]
+
+    new_events, _, line_count = log_reader.tail_events(events_file)
+    assert len(new_events) == 2
+    assert line_count == 2
+
+    event = log_reader.read_single_event(events_file, 0)
+    assert event is not None
+    assert event["data"]["cost"] != event["data"]["cost"]  # NaN
+    event = log_reader.read_single_event(events_file, 1)
+    assert event["data"]["id"] == 123456789012345678901234
+
+
 def test_read_events_corrupted_line(tmp_path):
     """Test handling of corrupted JSON lines."""
     events_file = tmp_path / "corrupted.jsonl"
@@ -101,6 +138,54 @@ def test_tail_events(tmp_path):
     assert new_line_count == 4
 
 
+def test_tail_events_partial_line(tmp_path):
+    """Test a line still being written is picked up once it is complete."""
+    events_file = tmp_path / "events.jsonl"
+    events_file.write_text('{"index": 0}\n{"ind')
+
+    new_events, position, line_count = log_reader.tail_events(events_file)
+
+    assert len(new_events) == 1
+    assert position == len('{"index": 0}\n')
+    assert line_count == 1
+
+    with open(events_file, "a", encoding="utf-8") as f:
+        f.write('ex": 1}\n')
+
+    new_events, position, line_count = log_reader.tail_events(
+        events_file, position, line_count
+    )
+
+    assert [e["line"] for e in new_events] == [1]
+    assert position == events_file.stat().st_size
+    assert line_count == 2
+
+
+def test_tail_events_shared_between_pollers(tmp_path, monkeypatch):
+    """Test repeated polls for one delta reuse the result until the file changes."""
+    events_file = tmp_path / "events.jsonl"
+    events_file.write_text('{"index": 0}\n')
+
+    parsed = []
+    parse = log_reader._parse_list_event
+    monkeypatch.setattr(
+        log_reader, "_parse_list_event", lambda line: parsed.append(line) or parse(line)
+    )
+
+    first = log_reader.tail_events(events_file)
+    second = log_reader.tail_events(events_file)
+    assert second == first
+    assert second[0] is not first[0]  # Each poller gets its own list
+    assert len(parsed) == 1
+
+    with open(events_file, "a", encoding="utf-8") as f:
+        f.write('{"index": 1}\n')
+
+    new_events, position, line_count = log_reader.tail_events(events_file)
+    assert [e["line"] for e in new_events] == [0, 1]
+    assert line_count == 2
+
+
 def test_count_lines(temp_events_file):
     """Test line counting."""
     count = log_reader.count_lines(temp_events_file)
@@ -111,3 +196,131 @@ def test_count_lines_missing_file():
     """Test counting lines in non-existent file."""
     count = log_reader.count_lines(Path("/nonexistent/file.jsonl"))
     assert count == 0
+
+
+def test_read_single_event_by_line_number(temp_events_file):
+    """Test reading an event by line number without a byte offset."""
+    event = log_reader.read_single_event(temp_events_file, 7)
+
+    assert event is not None
+    assert event["line"] == 7
+    assert event["data"]["index"] == 7
+    assert log_reader.read_single_event(temp_events_file, 10) is None
+
+
+def test_read_single_event_after_append(tmp_path):
+    """Test that the line index picks up lines appended after first use."""
+    events_file = tmp_path / "events.jsonl"
+    events_file.write_text('{"index": 0}\n{"index": 1}\n', encoding="utf-8")
+
+    assert log_reader.read_single_event(events_file, 2) is None
+
+    with open(events_file, "a", encoding="utf-8") as f:
+        f.write('{"index": 2}\n')
+
+    event = log_reader.read_single_event(events_file, 2)
+    assert event is not None
+    assert event["index"] == 2
+
+
+def test_line_offset_survives_truncation_race(tmp_path, monkeypatch):
+    """Test that a file emptied between stat and mmap yields None, not an error."""
+    events_file = tmp_path / "events.jsonl"
+    events_file.write_text('{"index": 0}\n', encoding="utf-8")
+
+    def truncated_mmap(*args, **kwargs):
+        raise ValueError("cannot mmap an empty file")
+
+    monkeypatch.setattr(log_reader.mmap, "mmap", truncated_mmap)
+    assert log_reader.get_line_offset(events_file, 0) is None
+
+    monkeypatch.undo()
+    assert log_reader.get_line_offset(events_file, 0) == 0
+
+
+def test_read_event_list_pagination(temp_events_file):
+    """Test lightweight event list with offset and limit."""
+    result = log_reader.read_event_list(temp_events_file, offset=2, limit=5)
+
+    assert [e["line"] for e in result["events"]] == [2, 3, 4, 5, 6]
+    assert result["total"] == 10
+    assert result["has_more"] is True
+    # Polling resumes after the last newline-terminated line
+    assert result["tail_position"] == temp_events_file.read_bytes().rfind(b"\n") + 1
+
+    # byte_offset points at the start of each event's line
+    first = result["events"][0]
+    event = log_reader.read_single_event(
+        temp_events_file, first["line"], first["byte_offset"]
+    )
+    assert event["data"]["index"] == 2
+
+
+def test_read_event_list_last_page(temp_events_file):
+    """Test reading the final page of events."""
+    result = log_reader.read_event_list(temp_events_file, offset=8, limit=5)
+
+    assert [e["line"] for e in result["events"]] == [8, 9]
+    assert result["total"] == 10
+    assert result["has_more"] is False
+
+
+def test_read_event_list_hands_partial_line_to_poller(tmp_path):
+    """Test an unfinished last line is left for tail_events, not skipped."""
+    events_file = tmp_path / "events.jsonl"
+    complete = '{"event": "a"}\n'
+    events_file.write_text(complete + '{"event": "b"}', encoding="utf-8")
+
+    result = log_reader.read_event_list(events_file)
+    assert [e["event"] for e in result["events"]] == ["a"]
+    assert result["tail_position"] == len(complete)
+    assert result["tail_line_count"] == 1
+
+    with open(events_file, "a", encoding="utf-8") as f:
+        f.write('\n{"event": "c"}\n')
+
+    new_events, position, line_count = log_reader.tail_events(
+        events_file, result["tail_position"], result["tail_line_count"]
+    )
+    assert [e["event"] for e in new_events] == ["b", "c"]
+    assert [e["line"] for e in new_events] == [1, 2]
+    assert position == events_file.stat().st_size
+    assert line_count == 3
+
+
+def test_read_event_list_offset_past_end(temp_events_file):
+    """Test an offset beyond the last line returns an empty page."""
+    result = log_reader.read_event_list(temp_events_file, offset=50, limit=5)
+
+    assert result["events"] == []
+    assert result["has_more"] is False
+
+
+def test_read_event_list_empty_file(tmp_path):
+    """Test event list on an empty log file."""
+    events_file = tmp_path / "events.jsonl"
+    events_file.touch()
+
+    result = log_reader.read_event_list(events_file)
+    assert result["events"] == []
+    assert result["total"] == 0
+
+
+def test_read_event_list_after_append(tmp_path):
+    """Test that a cached event list picks up lines appended later."""
+    events_file = tmp_path / "events.jsonl"
+    events_file.write_text('{"event": "a"}\n{"event": "b"}\n', encoding="utf-8")
+
+    first = log_reader.read_event_list(events_file)
+    assert [e["event"] for e in first["events"]] == ["a", "b"]
+    assert first["tail_position"] == events_file.stat().st_size
+
+    with open(events_file, "a", encoding="utf-8") as f:
+        f.write('{"event": "c"}\n')
+
+    second = log_reader.read_event_list(events_file)
+    assert [e["event"] for e in second["events"]] == ["a", "b", "c"]
+    assert second["total"] == 3
+    assert second["tail_position"] == events_file.stat().st_size
+    # The earlier result is not modified in place
+    assert len(first["events"]) == 2
@@ -1,7 +1,37 @@
 """Tests for server.py functionality."""
 
+import gzip
+import json
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+
 import pytest
+from amplifier_app_log_viewer import server
 from amplifier_app_log_viewer.server import create_app
+from amplifier_app_log_viewer.server import parse_date_filter
+
+
+@pytest.fixture
+def client_with_session(tmp_path):
+    """Create an app over one project with a session holding many events."""
+    projects_dir = tmp_path / ".amplifier" / "projects"
+    session_dir = projects_dir / "project-1" / "sessions" / "session-1"
+    session_dir.mkdir(parents=True)
+    (session_dir / "metadata.json").write_text(json.dumps({"created": ""}))
+    with open(session_dir / "events.jsonl", "w", encoding="utf-8") as f:
+        for i in range(200):
+            event = {
+                "ts": f"2025-11-10T15:30:{i % 60:02d}Z",
+                "event": "tool:pre",
+                "lvl": "INFO",
+                "session_id": "session-1",
+                "data": {"tool_name": "x"},
+            }
+            f.write(json.dumps(event) + "\n")
+
+    app = create_app(projects_dir)
+    return app.test_client()
 
 
 class TestBasePath:
@@ -42,6 +72,18 @@ class TestBasePath:
         with pytest.raises(ValueError, match="cannot contain '\\.\\.'"):
             create_app(base_path="/log-viewer/../etc")
 
+    def test_base_path_with_encoded_traversal_raises_error(self):
+        """Test that percent-encoded '..' and backslashes are rejected."""
+        with pytest.raises(ValueError, match="cannot contain '\\.\\.'"):
+            create_app(base_path="/log-viewer/%2E%2e/etc")
+        with pytest.raises(ValueError, match="cannot contain '\\.\\.'"):
+            create_app(base_path="/log-viewer\\etc")
+
+    def test_base_path_with_empty_segment_raises_error(self):
+        """Test that '//' inside base_path raises ValueError."""
+        with pytest.raises(ValueError, match="empty segments"):
+            create_app(base_path="/services//log-viewer")
+
     def test_base_path_with_special_characters_allowed(self):
         """Test that special characters (except '..') are allowed."""
         # These should be valid (reverse proxy will handle them)
@@ -61,3 +103,166 @@ class TestBasePath:
         app = create_app(base_path="/")
         # Trailing slash is stripped, leaving empty string
         assert app.config["APPLICATION_ROOT"] == ""
+
+
+class TestParseDateFilter:
+    """Test date filter parsing."""
+
+    def test_iso_date_defaults_to_utc(self):
+        """Test that ISO dates without an offset are treated as UTC."""
+        expected = datetime(2025, 11, 10, tzinfo=timezone.utc)
+        assert parse_date_filter("2025-11-10") == expected
+        assert parse_date_filter("2025-11-10T00:00:00Z") == expected
+
+    def test_relative_period_is_relative_to_now(self):
+        """Test that repeated relative filters track the current time."""
+        before = datetime.now(timezone.utc)
+        first = parse_date_filter("7d")
+        second = parse_date_filter("7d")
+        assert before - timedelta(days=7) <= first <= second
+
+    def test_invalid_or_empty_returns_none(self):
+        """Test that unparseable or empty filters mean no filter."""
+        assert parse_date_filter(None) is None
+        assert parse_date_filter("") is None
+        assert parse_date_filter("xd") is None
+        assert parse_date_filter("not-a-date") is None
+
+
+class TestCompression:
+    """Test compression of JSON responses."""
+
+    def test_large_json_is_gzipped_when_accepted(self, client_with_session):
+        """Test that large JSON bodies are gzipped for gzip-capable clients."""
+        response = client_with_session.get(
+            "/api/events/list?session=session-1",
+            headers={"Accept-Encoding": "gzip, deflate"},
+        )
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert "Accept-Encoding" in response.headers["Vary"]
+        body = json.loads(gzip.decompress(response.data))
+        assert len(body["events"]) == 200
+
+    def test_json_is_plain_without_accept_encoding(self, client_with_session):
+        """Test that clients not accepting gzip get an uncompressed body."""
+        response = client_with_session.get("/api/events/list?session=session-1")
+        assert "Content-Encoding" not in response.headers
+        assert len(response.get_json()["events"]) == 200
+
+    def test_zstd_preferred_when_available(self, client_with_session):
+        """Test that zstd-capable clients get zstd when zstandard is installed."""
+        zstandard = pytest.importorskip("zstandard")
+        response = client_with_session.get(
+            "/api/events/list?session=session-1",
+            headers={"Accept-Encoding": "gzip, zstd"},
+        )
+        assert response.headers["Content-Encoding"] == "zstd"
+        body = json.loads(zstandard.ZstdDecompressor().decompress(response.data))
+        assert len(body["events"]) == 200
+
+    def test_gzip_fallback_without_zstandard(self, client_with_session, monkeypatch):
+        """Test that zstd in Accept-Encoding falls back to gzip if unsupported."""
+        monkeypatch.setattr(server, "zstandard", None)
+        response = client_with_session.get(
+            "/api/events/list?session=session-1",
+            headers={"Accept-Encoding": "gzip, zstd"},
+        )
+        assert response.headers["Content-Encoding"] == "gzip"
+
+
+class TestConditionalRequests:
+    """Test ETag revalidation of polled endpoints."""
+
+    def test_unchanged_projects_return_304(self, client_with_session):
+        """Test that a matching If-None-Match gets an empty 304."""
+        first = client_with_session.get("/api/projects")
+        assert first.status_code == 200
+        etag = first.headers["ETag"]
+
+        second = client_with_session.get(
+            "/api/projects", headers={"If-None-Match": etag}
+        )
+        assert second.status_code == 304
+        assert second.data == b""
+
+    def test_sessions_etag_depends_on_filter(self, client_with_session):
+        """Test that different query results carry different ETags."""
+        all_sessions = client_with_session.get("/api/sessions?project=project-1")
+        filtered = client_with_session.get(
+            "/api/sessions?project=project-1&since=2000-01-01",
+            headers={"If-None-Match": all_sessions.headers["ETag"]},
+        )
+        assert filtered.status_code == 200
+        assert filtered.get_json() == {"sessions": []}
+
+
+class TestSessionMetadata:
+    """Test the session metadata endpoint."""
+
+    def test_metadata_context_follows_file_changes(self, client_with_session, tmp_path):
+        """Test that a rewritten metadata.json is re-read."""
+        metadata_path = (
+            tmp_path / ".amplifier/projects/project-1/sessions/session-1/metadata.json"
+        )
+        metadata_path.write_text(json.dumps({"context": {"cwd": "/a"}}))
+        response = client_with_session.get("/api/session/session-1/metadata")
+        assert response.get_json()["context"] == {"cwd": "/a"}
+
+        metadata_path.write_text(json.dumps({"context": {"cwd": "/longer"}}))
+        response = client_with_session.get("/api/session/session-1/metadata")
+        assert response.get_json()["context"] == {"cwd": "/longer"}
+
+        metadata_path.unlink()
+        response = client_with_session.get("/api/session/session-1/metadata")
+        assert response.get_json()["context"] == {}
+
+
+class TestPayloadCache:
+    """Test reuse of serialized session listings between refreshes."""
+
+    def test_sessions_listing_updates_after_refresh(
+        self, client_with_session, tmp_path
+    ):
+        """Test that a cached listing is replaced once the tree is refreshed."""
+        first = client_with_session.get("/api/sessions?project=project-1")
+        assert [s["id"] for s in first.get_json()["sessions"]] == ["session-1"]
+        again = client_with_session.get("/api/sessions?project=project-1")
+        assert again.data == first.data
+
+        sessions_dir = tmp_path / ".amplifier/projects/project-1/sessions"
+        (sessions_dir / "session-2").mkdir()
+        client_with_session.post("/api/refresh")
+
+        updated = client_with_session.get("/api/sessions?project=project-1")
+        ids = [s["id"] for s in updated.get_json()["sessions"]]
+        assert ids == ["session-1", "session-2"]
+
+
+class TestRefreshLogging:
+    """Test the refresh log line."""
+
+    def test_unchanged_refresh_is_quiet(self, client_with_session, tmp_path, capsys):
+        """Test that only refreshes that found something new are logged."""
+        capsys.readouterr()
+        client_with_session.post("/api/refresh")
+        assert "[Refresh]" not in capsys.readouterr().out
+
+        sessions_dir = tmp_path / ".amplifier/projects/project-1/sessions"
+        (sessions_dir / "session-2").mkdir()
+        client_with_session.post("/api/refresh")
+        assert "[Refresh] 1 projects, 2 sessions" in capsys.readouterr().out
+
+
+class TestIndexPage:
+    """Test the main HTML page."""
+
+    def test_index_rendered_per_mount_point(self, tmp_path):
+        """Test that the cached page still reflects the base path."""
+        client = create_app(tmp_path, base_path="/log-viewer").test_client()
+
+        first = client.get("/log-viewer/")
+        second = client.get("/log-viewer/")
+        assert first.status_code == 200
+        assert first.data == second.data
+        assert b"const API_BASE = '/log-viewer'" in first.data
+        assert b"/log-viewer/static/app.js" in first.data
@@ -1,6 +1,8 @@
 """Tests for session_scanner module."""
 
 import json
+from datetime import datetime
+from datetime import timezone
 
 import pytest
 from amplifier_app_log_viewer import session_scanner
@@ -60,6 +62,16 @@ def test_get_session(mock_amplifier_home):
     assert session.project_slug == "project-1"
 
 
+def test_get_project(mock_amplifier_home):
+    """Test looking up a project by slug."""
+    tree = session_scanner.scan_projects(mock_amplifier_home)
+
+    project = session_scanner.get_project("project-2", tree)
+    assert project is not None
+    assert project.slug == "project-2"
+    assert session_scanner.get_project("nonexistent", tree) is None
+
+
 def test_get_session_not_found(mock_amplifier_home):
     """Test getting non-existent session."""
     tree = session_scanner.scan_projects(mock_amplifier_home)
@@ -81,6 +93,42 @@ def test_session_hierarchy(mock_amplifier_home):
     assert hierarchy[1].id == "session-project-1-1"  # Child
 
 
+def test_session_hierarchy_stops_on_parent_cycle(tmp_path):
+    """Test that a parent_session_id cycle doesn't loop forever."""
+    sessions_dir = tmp_path / "projects" / "project-1" / "sessions"
+    for session_id, parent_id in [("a", "b"), ("b", "a")]:
+        session_dir = sessions_dir / session_id
+        session_dir.mkdir(parents=True)
+        metadata = {"parent_session_id": parent_id}
+        (session_dir / "metadata.json").write_text(json.dumps(metadata))
+
+    tree = session_scanner.scan_projects(tmp_path)
+
+    hierarchy = session_scanner.get_session_hierarchy("a", tree)
+    assert [s.id for s in hierarchy] == ["b", "a"]
+
+
+def test_scan_projects_reads_metadata_with_nan(tmp_path):
+    """Test metadata that json accepts but orjson rejects is still read."""
+    session_dir = tmp_path / "projects" / "project-1" / "sessions" / "child"
+    session_dir.mkdir(parents=True)
+    metadata = {
+        "created": "2025-11-10T15:30:00Z",
+        "parent_session_id": "parent",
+        "name": "child session",
+        "context": {"cost": float("nan")},
+    }
+    (session_dir / "metadata.json").write_text(json.dumps(metadata))
+
+    tree = session_scanner.scan_projects(tmp_path)
+
+    session = session_scanner.get_session("child", tree)
+    assert session is not None
+    assert session.timestamp == "2025-11-10T15:30:00Z"
+    assert session.parent_id == "parent"
+    assert session.name == "child session"
+
+
 def test_scan_projects_missing_directory(tmp_path):
     """Test scanning when projects directory doesn't exist returns empty tree."""
     tree = session_scanner.scan_projects(tmp_path / "nonexistent")
@@ -95,3 +143,71 @@ def test_session_children_populated(mock_amplifier_home):
     parent = session_scanner.get_session("session-project-1-0", tree)
     assert parent is not None
     assert len(parent.children) == 2  # Sessions 1 and 2 are children
+    assert sorted(parent.child_ids) == ["session-project-1-1", "session-project-1-2"]
+
+
+def test_scan_projects_parallel_reads_match_serial(mock_amplifier_home, monkeypatch):
+    """Test that metadata read on the thread pool builds the same tree."""
+    serial = session_scanner.scan_projects(mock_amplifier_home)
+    monkeypatch.setattr(session_scanner, "_PARALLEL_READ_MIN", 1)
+    monkeypatch.setattr(session_scanner, "_READ_BATCH_SIZE", 2)
+    parallel = session_scanner.scan_projects(mock_amplifier_home)
+
+    assert list(parallel.session_index) == list(serial.session_index)
+    for session_id, session in serial.session_index.items():
+        other = parallel.session_index[session_id]
+        assert other.project_slug == session.project_slug
+        assert other.parent_id == session.parent_id
+        assert other.child_ids == session.child_ids
+
+
+def test_session_timestamp_dt(tmp_path):
+    """Test the parsed session timestamp, including naive and invalid values."""
+
+    def make_session(timestamp):
+        return session_scanner.Session(
+            id="session",
+            project_slug="project",
+            timestamp=timestamp,
+            parent_id=None,
+            children=[],
+            events_path=tmp_path / "events.jsonl",
+            transcript_path=tmp_path / "transcript.jsonl",
+        )
+
+    expected = datetime(2025, 11, 10, 15, 30, tzinfo=timezone.utc)
+    assert make_session("2025-11-10T15:30:00Z").timestamp_dt == expected
+    assert make_session("2025-11-10T15:30:00").timestamp_dt == expected
+    assert make_session("not a date").timestamp_dt is None
+    assert make_session("").timestamp_dt is None
+
+
+def test_project_sessions_in_range(tmp_path):
+    """Test date-range selection returns matching sessions in ID order."""
+    sessions = [
+        session_scanner.Session(
+            id=session_id,
+            project_slug="project",
+            timestamp=timestamp,
+            parent_id=None,
+            children=[],
+            events_path=tmp_path / "events.jsonl",
+            transcript_path=tmp_path / "transcript.jsonl",
+        )
+        for session_id, timestamp in [
+            ("a", "2025-11-12T00:00:00Z"),
+            ("b", "2025-11-10T00:00:00Z"),
+            ("c", ""),
+            ("d", "2025-11-11T00:00:00Z"),
+        ]
+    ]
+    project = session_scanner.Project(slug="project", path=tmp_path, sessions=sessions)
+
+    start = datetime(2025, 11, 11, tzinfo=timezone.utc)
+    end = datetime(2025, 11, 12, tzinfo=timezone.utc)
+
+    assert [s.id for s in project.sessions_in_range(start)] == ["a", "d"]
+    assert [s.id for s in project.sessions_in_range(None, start)] == ["b", "d"]
+    assert [s.id for s in project.sessions_in_range(start, end)] == ["a", "d"]
+    assert project.count_sessions_in_range(start, end) == 2
+    assert project.sessions_in_range(None, None) == sessions